@@ -12,7 +12,8 @@ class EventBus:
 
     def subscribe(self, event_name: str, callback):
         print(f"[EventBus] Subscribing '{getattr(callback, '__name__', 'lambda')}' to event '{event_name}'")
-        self._subscribers[event_name].append(callback)
+        # Whether a callback is a coroutine function never changes, so check it once here
+        self._subscribers[event_name].append((callback, inspect.iscoroutinefunction(callback)))
 
     def emit(self, event_name: str, *args, **kwargs):
         """
@@ -22,9 +23,9 @@ class EventBus:
         print(f"[EventBus] Emitting event '{event_name}'")
 
         if event_name in self._subscribers:
-            for callback in self._subscribers[event_name]:
+            for callback, is_coroutine in self._subscribers[event_name]:
                 try:
-                    if inspect.iscoroutinefunction(callback):
+                    if is_coroutine:
                         # If the callback is an async def function, schedule it on the event loop
                         asyncio.create_task(callback(*args, **kwargs))
                     else:
@@ -1,4 +1,5 @@
 # src/ava/gui/code_viewer.py
+import asyncio
 import logging
 from pathlib import Path
 from PySide6.QtWidgets import (QMainWindow, QVBoxLayout, QWidget, QSplitter,
@@ -142,8 +143,11 @@ class CodeViewerWindow(QMainWindow):
 
     def _save_all_files(self) -> None:
         if self.editor_manager:
-            if self.editor_manager.save_all_files():
-                self.status_bar.showMessage("All files saved", 2000)
+            asyncio.create_task(self._save_all_files_async())
+
+    async def _save_all_files_async(self) -> None:
+        if await self.editor_manager.save_all_files_async():
+            self.status_bar.showMessage("All files saved", 2000)
 
     def _close_current_tab(self) -> None:
         if self.editor_manager:
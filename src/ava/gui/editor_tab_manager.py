@@ -1,10 +1,12 @@
 # src/ava/gui/editor_tab_manager.py
 import asyncio
 import os
+import sys
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QUrl
 from PySide6.QtGui import QTextCursor
 from PySide6.QtWidgets import QTabWidget, QLabel, QWidget, QMessageBox
 
@@ -18,25 +20,93 @@ from src.ava.core.project_manager import ProjectManager
 class EditorTabManager:
     """Manages editor tabs with enhanced code editors and file saving."""
 
+    PATH_CACHE_LIMIT = 4096
+    LSP_DEBOUNCE_INTERVAL_MS = 50
+
     def __init__(self, tab_widget: QTabWidget, event_bus: EventBus, project_manager: ProjectManager):
         self.tab_widget = tab_widget
         self.event_bus = event_bus
         self.project_manager = project_manager
         self.editors: Dict[str, EnhancedCodeEditor] = {}
+        self._rel_paths: Dict[str, str] = {}
+        self._tab_titles: Dict[str, str] = {}
+        self._path_cache: Dict[Tuple[str, str], str] = {}
+        self._uri_to_norm: Dict[str, str] = {}
+        self._path_to_index: Dict[str, int] = {}
+        self._pending_content: Dict[str, str] = {}
         self.lsp_client = None
         self._is_generating = False
+
+        # Debounces 'didOpen' so a burst of content updates becomes one LSP batch
+        self._lsp_pending: Dict[str, str] = {}
+        self._lsp_timer = QTimer()
+        self._lsp_timer.setSingleShot(True)
+        self._lsp_timer.setInterval(self.LSP_DEBOUNCE_INTERVAL_MS)
+        self._lsp_timer.timeout.connect(self._flush_lsp_pending)
+
+        self.tab_widget.tabBar().tabMoved.connect(self._rebuild_tab_index)
+        self.tab_widget.currentChanged.connect(self._on_current_tab_changed)
         self._setup_initial_state()
         self._connect_events()
 
     def _resolve_and_normalize_path(self, path_str: str) -> Optional[str]:
         """Resolves a given path (relative or absolute) against the project root and normalizes it for cross-platform key consistency."""
+        project_root = self.project_manager.active_project_path if self.project_manager else None
+        cache_key = (str(project_root) if project_root else "", path_str)
+        cached = self._path_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         path = Path(path_str)
         if not path.is_absolute():
-            if self.project_manager and self.project_manager.active_project_path:
-                path = self.project_manager.active_project_path / path
+            if project_root:
+                path = project_root / path
             else:
                 return None
-        return os.path.normcase(str(path.resolve()))
+        # Interned so every dict keyed by this path shares one string object
+        norm_path = sys.intern(os.path.normcase(str(path.resolve())))
+
+        if len(self._path_cache) >= self.PATH_CACHE_LIMIT:
+            self._path_cache.clear()
+        self._path_cache[cache_key] = norm_path
+        return norm_path
+
+    def _compute_rel_path(self, norm_path_str: str) -> Optional[str]:
+        """Returns the project-relative POSIX path for a tab, or None if it lies outside the project."""
+        if not (self.project_manager and self.project_manager.active_project_path):
+            return None
+        try:
+            return Path(norm_path_str).relative_to(self.project_manager.active_project_path).as_posix()
+        except ValueError:
+            return None
+
+    def _remember_rel_path(self, norm_path_str: str):
+        rel_path = self._compute_rel_path(norm_path_str)
+        if rel_path is not None:
+            self._rel_paths[norm_path_str] = rel_path
+        else:
+            self._rel_paths.pop(norm_path_str, None)
+
+    def _rebuild_tab_index(self, *_):
+        self._path_to_index = {}
+        for i in range(self.tab_widget.count()):
+            tab_path = self.tab_widget.tabToolTip(i)
+            if tab_path:
+                self._path_to_index[tab_path] = i
+
+    def _tab_index_for_path(self, norm_path_str: str) -> int:
+        """
+        Returns the index of the tab showing the given path, or -1 if it is not open.
+        Cached indices are verified on use and the map is rebuilt on a miss, so
+        removals and reorders only ever cost a single rescan.
+        """
+        index = self._path_to_index.get(norm_path_str)
+        if index is not None and index < self.tab_widget.count() and self.tab_widget.tabToolTip(index) == norm_path_str:
+            return index
+        if norm_path_str not in self.editors and norm_path_str not in self._pending_content:
+            return -1
+        self._rebuild_tab_index()
+        return self._path_to_index.get(norm_path_str, -1)
 
     def set_lsp_client(self, lsp_client):
         """Sets the LSP client instance for communication."""
@@ -69,25 +139,31 @@ class EditorTabManager:
             elif reply == QMessageBox.StandardButton.Cancel:
                 return
 
+        self._path_cache.clear()
         self.clear_all_tabs()
         self._add_welcome_tab("Ready for new project generation...")
         print("[EditorTabManager] State reset for new project session.")
 
     def clear_all_tabs(self):
-        while self.tab_widget.count() > 0:
-            widget_to_remove = self.tab_widget.widget(0)
-            self.tab_widget.removeTab(0)
-            if widget_to_remove in self.editors.values():
-                path_key_to_remove = None
-                for key, editor_instance in self.editors.items():
-                    if editor_instance == widget_to_remove:
-                        path_key_to_remove = key
-                        break
-                if path_key_to_remove:
-                    del self.editors[path_key_to_remove]
+        # Every editor goes away, so drop the bookkeeping first instead of
+        # reverse-looking up each removed widget's path.
+        self._lsp_pending.clear()
+        self._pending_content.clear()
+        self.editors.clear()
+        self._rel_paths.clear()
+        self._tab_titles.clear()
+        self._path_to_index.clear()
+
+        widgets_to_remove = [self.tab_widget.widget(i) for i in range(self.tab_widget.count())]
+        # Nothing is left to materialize, so the intermediate currentChanged emissions are pointless
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.clear()
+        finally:
+            self.tab_widget.blockSignals(False)
+        for widget_to_remove in widgets_to_remove:
             if widget_to_remove:
                 widget_to_remove.deleteLater()
-        self.editors.clear()
 
     def get_active_file_path(self) -> Optional[str]:
         current_index = self.tab_widget.currentIndex()
@@ -114,7 +190,10 @@ class EditorTabManager:
             self._add_welcome_tab("No files were changed in this modification.")
             return
 
-        final_paths_to_display = {self._resolve_and_normalize_path(p) for p in files_to_display.keys()}
+        # One ordered pass resolves and de-duplicates the paths; the first entry for a path wins
+        final_paths_to_display: Dict[Optional[str], Tuple[str, str]] = {}
+        for path_str, content in files_to_display.items():
+            final_paths_to_display.setdefault(self._resolve_and_normalize_path(path_str), (path_str, content))
 
         # Close tabs that are not in the final list
         tabs_to_close = []
@@ -123,40 +202,114 @@ class EditorTabManager:
             if tab_path not in final_paths_to_display:
                 tabs_to_close.append(i)
 
-        for i in sorted(tabs_to_close, reverse=True):
-            self.close_tab(i, force_close=True)  # Force close as this is a programmatic cleanup
+        self.close_tabs(tabs_to_close)  # Force close as this is a programmatic cleanup
 
-        # Ensure all required tabs are open (in case they weren't streamed)
-        for path_str, content in files_to_display.items():
-            norm_path = self._resolve_and_normalize_path(path_str)
-            if norm_path not in self.editors:
+        # Ensure all required tabs are open (in case they weren't streamed).
+        # Only the focused file gets a real editor now; the rest are built when first shown.
+        first_file_path = next(iter(final_paths_to_display))
+        for norm_path, (path_str, content) in final_paths_to_display.items():
+            if not norm_path or norm_path in self.editors or norm_path in self._pending_content:
+                continue
+            if norm_path == first_file_path:
                 self.create_or_update_tab(path_str, content)
+            else:
+                self._add_placeholder_tab(norm_path, content)
 
         # Focus the first tab in the list
-        first_file_path = self._resolve_and_normalize_path(next(iter(files_to_display)))
         if first_file_path:
             self.focus_tab(first_file_path)
 
-    def create_editor_tab(self, norm_path_str: str) -> bool:
-        if norm_path_str in self.editors:
-            self.focus_tab(norm_path_str)
-            return False
-
+    def _remove_welcome_tab(self):
         if self.tab_widget.count() == 1 and isinstance(self.tab_widget.widget(0), QLabel):
             self.tab_widget.removeTab(0)
 
+    def _add_placeholder_tab(self, norm_path_str: str, content: str):
+        """Adds a lightweight tab whose editor is only created when the tab is first shown."""
+        self._remove_welcome_tab()
+        tab_index = self.tab_widget.addTab(QWidget(), Path(norm_path_str).name)
+        self.tab_widget.setTabToolTip(tab_index, norm_path_str)
+        self._path_to_index[norm_path_str] = tab_index
+        self._pending_content[norm_path_str] = content
+
+    def _on_current_tab_changed(self, index: int):
+        if index == -1:
+            return
+        norm_path_str = self.tab_widget.tabToolTip(index)
+        if norm_path_str in self._pending_content:
+            self._materialize_tab(norm_path_str)
+
+    def _materialize_tab(self, norm_path_str: str) -> bool:
+        """Swaps a placeholder tab for a real editor loaded with its deferred content."""
+        if norm_path_str not in self._pending_content:
+            return False
+        index = self._tab_index_for_path(norm_path_str)
+        content = self._pending_content.pop(norm_path_str)
+        if index == -1:
+            return False
+
+        was_current = self.tab_widget.currentIndex() == index
+        placeholder = self.tab_widget.widget(index)
+        editor = self._build_editor(norm_path_str)
+
+        # Signals are blocked so the swap does not cascade into materializing neighbouring tabs
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, editor, Path(norm_path_str).name)
+            self.tab_widget.setTabToolTip(index, norm_path_str)
+            if was_current:
+                self.tab_widget.setCurrentIndex(index)
+        finally:
+            self.tab_widget.blockSignals(False)
+        if placeholder:
+            placeholder.deleteLater()
+
+        self._path_to_index[norm_path_str] = index
+        self.editors[norm_path_str] = editor
+        self._remember_rel_path(norm_path_str)
+        self.set_editor_content(norm_path_str, content)
+        return True
+
+    def _build_editor(self, norm_path_str: str) -> EnhancedCodeEditor:
         editor = EnhancedCodeEditor()
         if norm_path_str.endswith('.py'):
-            PythonHighlighter(editor.document())
+            editor.highlighter = PythonHighlighter(editor.document())
         elif norm_path_str.endswith('.gd'):
-            GenericHighlighter(editor.document(), 'gdscript')
+            editor.highlighter = GenericHighlighter(editor.document(), 'gdscript')
+
+        # The path lives on the editor so renames/moves only need to update the property
+        editor.setProperty("norm_path", norm_path_str)
+        editor.save_requested.connect(partial(self._on_editor_save_requested, editor))
+        editor.content_changed.connect(partial(self._on_editor_content_changed, editor))
+        return editor
+
+    def _on_editor_save_requested(self, editor: EnhancedCodeEditor):
+        norm_path_str = editor.property("norm_path")
+        if norm_path_str:
+            self.save_file(norm_path_str)
+
+    def _on_editor_content_changed(self, editor: EnhancedCodeEditor):
+        norm_path_str = editor.property("norm_path")
+        if norm_path_str:
+            self._update_tab_title(norm_path_str)
 
-        editor.save_requested.connect(lambda: self.save_file(norm_path_str))
-        editor.content_changed.connect(lambda: self._update_tab_title(norm_path_str))
+    def create_editor_tab(self, norm_path_str: str) -> bool:
+        if norm_path_str in self.editors:
+            self.focus_tab(norm_path_str)
+            return False
+
+        if norm_path_str in self._pending_content:
+            return self._materialize_tab(norm_path_str)
+
+        self._remove_welcome_tab()
+
+        editor = self._build_editor(norm_path_str)
 
         tab_index = self.tab_widget.addTab(editor, Path(norm_path_str).name)
         self.tab_widget.setTabToolTip(tab_index, norm_path_str)
+        self._path_to_index[norm_path_str] = tab_index
         self.editors[norm_path_str] = editor
+        self._remember_rel_path(norm_path_str)
         print(f"[EditorTabManager] Created enhanced editor tab for: {norm_path_str}")
         return True
 
@@ -166,30 +319,47 @@ class EditorTabManager:
 
             scrollbar = editor.verticalScrollBar()
             original_scroll_value = scrollbar.value()
+            was_at_bottom = original_scroll_value == scrollbar.maximum()
 
-            old_content = editor.toPlainText()
-            old_line_count = old_content.count('\n')
-            new_line_count = content.count('\n')
-            line_diff = new_line_count - old_line_count
+            # QTextDocument keeps blockCount up to date incrementally, so neither side rescans the text
+            old_line_count = editor.document().blockCount()
 
-            cursor = editor.textCursor()
-            cursor.beginEditBlock()
-            cursor.select(QTextCursor.SelectionType.Document)
-            cursor.insertText(content)
-            cursor.endEditBlock()
+            # Detach the highlighter during the bulk replace; re-attaching it runs a single full pass
+            highlighter = editor.highlighter
+            if highlighter:
+                highlighter.setDocument(None)
+
+            # setPlainText replaces the document in one pass without recording an undo frame for the old text
+            editor.setPlainText(content)
+
+            if highlighter:
+                highlighter.setDocument(editor.document())
+
+            line_diff = editor.document().blockCount() - old_line_count
 
             editor._original_content = content
             editor._is_dirty = False
 
-            if original_scroll_value == scrollbar.maximum() or original_scroll_value == 0:
+            if was_at_bottom and original_scroll_value != 0:
+                scrollbar.setValue(scrollbar.maximum())
+            elif original_scroll_value == 0:
                 pass
             else:
                 line_height = editor.fontMetrics().height()
                 scrollbar.setValue(original_scroll_value + (line_diff * line_height))
 
             self._update_tab_title(norm_path_str)
-            if self.lsp_client:
-                asyncio.create_task(self.lsp_client.did_open(norm_path_str, content))
+            # While generating, set_generating_state(False) re-opens every document anyway
+            if self.lsp_client and not self._is_generating:
+                self._lsp_pending[norm_path_str] = content
+                self._lsp_timer.start()
+
+    def _flush_lsp_pending(self):
+        if not self._lsp_pending:
+            return
+        documents = list(self._lsp_pending.items())
+        self._lsp_pending.clear()
+        asyncio.create_task(self._batch_did_open(documents))
 
     def stream_content_to_editor(self, filename: str, chunk: str):
         norm_path = self._resolve_and_normalize_path(filename)
@@ -210,11 +380,11 @@ class EditorTabManager:
             editor.verticalScrollBar().setValue(editor.verticalScrollBar().maximum())
 
     def focus_tab(self, norm_path_str: str):
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabToolTip(i) == norm_path_str:
-                self.tab_widget.setCurrentIndex(i)
-                return True
-        return False
+        index = self._tab_index_for_path(norm_path_str)
+        if index == -1:
+            return False
+        self.tab_widget.setCurrentIndex(index)
+        return True
 
     def open_file_in_tab(self, file_path: Path):
         if not file_path.is_file(): return
@@ -233,7 +403,7 @@ class EditorTabManager:
             print(f"[EditorTabManager] Error opening file {file_path}: {e}")
             QMessageBox.warning(self.tab_widget, "Open File Error", f"Could not open file:\n{file_path.name}\n\n{e}")
 
-    def close_tab(self, index: int, force_close: bool = False):
+    def close_tab(self, index: int, force_close: bool = False, notify_lsp: bool = True):
         norm_path_str = self.tab_widget.tabToolTip(index)
         widget_to_remove = self.tab_widget.widget(index)
 
@@ -249,10 +419,17 @@ class EditorTabManager:
                 elif reply == QMessageBox.StandardButton.Cancel:
                     return
 
-            if self.lsp_client:
+            if self.lsp_client and notify_lsp:
                 asyncio.create_task(self.lsp_client.did_close(norm_path_str))
 
             del self.editors[norm_path_str]
+            self._rel_paths.pop(norm_path_str, None)
+            self._tab_titles.pop(norm_path_str, None)
+            self._path_to_index.pop(norm_path_str, None)
+            self._lsp_pending.pop(norm_path_str, None)
+        elif norm_path_str in self._pending_content:
+            del self._pending_content[norm_path_str]
+            self._path_to_index.pop(norm_path_str, None)
 
         self.tab_widget.removeTab(index)
         if widget_to_remove:
@@ -261,24 +438,56 @@ class EditorTabManager:
         if self.tab_widget.count() == 0:
             self._add_welcome_tab("All tabs closed. Open a file or generate code.")
 
+    def close_tabs(self, indices: List[int]):
+        """
+        Force-closes several tabs at once, for programmatic cleanup. Unsaved changes
+        are discarded, and the LSP is told about every closed document in one batch.
+        """
+        if not indices:
+            return
+
+        unique_indices = sorted(set(indices), reverse=True)
+        if self.lsp_client:
+            closing_paths = [path for path in (self.tab_widget.tabToolTip(i) for i in unique_indices) if path in self.editors]
+            if closing_paths:
+                asyncio.create_task(self._batch_did_close(closing_paths))
+
+        # Signals stay blocked so each intermediate current tab is not materialized in turn
+        self.tab_widget.setUpdatesEnabled(False)
+        self.tab_widget.blockSignals(True)
+        try:
+            for i in unique_indices:
+                self.close_tab(i, force_close=True, notify_lsp=False)
+        finally:
+            self.tab_widget.blockSignals(False)
+            self.tab_widget.setUpdatesEnabled(True)
+        self._on_current_tab_changed(self.tab_widget.currentIndex())
+
     def save_file(self, norm_path_str: str) -> bool:
         if norm_path_str not in self.editors: return False
         editor = self.editors[norm_path_str]
         try:
-            file_path = Path(norm_path_str)
-            content = editor.toPlainText()
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(content, encoding='utf-8')
+            self._write_file(Path(norm_path_str), editor.toPlainText())
             editor.mark_clean()
             self._update_tab_title(norm_path_str)
-            if self.project_manager and self.project_manager.active_project_path:
-                rel_path = file_path.relative_to(self.project_manager.active_project_path).as_posix()
-                self.project_manager.stage_file(rel_path)
+            self._stage_saved_file(norm_path_str)
             return True
         except Exception as e:
             self._show_save_error(Path(norm_path_str).name, str(e))
             return False
 
+    @staticmethod
+    def _write_file(file_path: Path, content: str):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding='utf-8')
+
+    def _stage_saved_file(self, norm_path_str: str):
+        if self.project_manager and self.project_manager.active_project_path:
+            rel_path = self._rel_paths.get(norm_path_str)
+            if rel_path is None:
+                rel_path = Path(norm_path_str).relative_to(self.project_manager.active_project_path).as_posix()
+            self.project_manager.stage_file(rel_path)
+
     def save_current_file(self) -> bool:
         current_path = self.get_active_file_path()
         if current_path:
@@ -294,18 +503,49 @@ class EditorTabManager:
                     all_saved = False
         return all_saved
 
+    async def save_all_files_async(self) -> bool:
+        """
+        Saves every dirty editor with the disk writes running in worker threads.
+        Contents are captured on the UI thread, and an editor edited again while
+        its write was in flight stays dirty.
+        """
+        snapshots = [(norm_path_str, editor.toPlainText())
+                     for norm_path_str, editor in self.editors.items() if editor.is_dirty()]
+        if not snapshots:
+            return True
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._write_file, Path(norm_path_str), content)
+              for norm_path_str, content in snapshots),
+            return_exceptions=True
+        )
+        all_saved = True
+        for (norm_path_str, content), result in zip(snapshots, results):
+            if isinstance(result, Exception):
+                all_saved = False
+                self._show_save_error(Path(norm_path_str).name, str(result))
+                continue
+            editor = self.editors.get(norm_path_str)
+            if not editor:
+                continue
+            editor.mark_saved(content)
+            self._update_tab_title(norm_path_str)
+            self._stage_saved_file(norm_path_str)
+        return all_saved
+
     def has_unsaved_changes(self) -> bool:
         return any(editor.is_dirty() for editor in self.editors.values())
 
     def _update_tab_title(self, norm_path_str: str):
         if norm_path_str not in self.editors: return
         editor = self.editors[norm_path_str]
-        base_name = Path(norm_path_str).name
-        title = f"{'*' if editor.is_dirty() else ''}{base_name}"
-        for i in range(self.tab_widget.count()):
-            if self.tab_widget.tabToolTip(i) == norm_path_str:
-                self.tab_widget.setTabText(i, title)
-                break
+        title = f"{'*' if editor.is_dirty() else ''}{os.path.basename(norm_path_str)}"
+        # setTabText relayouts the tab bar even for an identical string, so skip no-op updates
+        if self._tab_titles.get(norm_path_str) == title:
+            return
+        index = self._tab_index_for_path(norm_path_str)
+        if index != -1:
+            self.tab_widget.setTabText(index, title)
+            self._tab_titles[norm_path_str] = title
 
     def _show_save_error(self, filename: str, error: str):
         QMessageBox.critical(self.tab_widget, "Save Error", f"Could not save '{filename}'\nError: {error}")
@@ -315,8 +555,13 @@ class EditorTabManager:
             return
 
         try:
-            file_path = Path(uri.replace("file:///", "").replace("%3A", ":"))
-            norm_path_str = os.path.normcase(str(file_path.resolve()))
+            norm_path_str = self._uri_to_norm.get(uri)
+            if norm_path_str is None:
+                # LSP URIs are already absolute, so no resolve() (and its stat calls) is needed
+                norm_path_str = sys.intern(os.path.normcase(os.path.normpath(QUrl(uri).toLocalFile())))
+                if len(self._uri_to_norm) >= self.PATH_CACHE_LIMIT:
+                    self._uri_to_norm.clear()
+                self._uri_to_norm[uri] = norm_path_str
             if norm_path_str in self.editors:
                 self.editors[norm_path_str].set_diagnostics(diagnostics)
         except Exception as e:
@@ -363,53 +608,78 @@ class EditorTabManager:
         """Controls whether to suppress LSP diagnostics."""
         print(f"[EditorTabManager] Setting generating state to: {is_generating}")
         self._is_generating = is_generating
-        if not is_generating:
-            for path_str, editor in self.editors.items():
-                editor.set_diagnostics([])
-                asyncio.create_task(self.lsp_client.did_open(path_str, editor.toPlainText()))
-        else:
-            for editor in self.editors.values():
-                editor.set_diagnostics([])
+        for editor in self.editors.values():
+            editor.set_diagnostics([])
+        self._lsp_pending.clear()
+        if not is_generating and self.lsp_client and self.editors:
+            documents = [(path_str, editor.toPlainText()) for path_str, editor in self.editors.items()]
+            asyncio.create_task(self._batch_did_open(documents))
+
+    async def _batch_did_close(self, paths: List[str]):
+        """Sends 'didClose' for several documents from a single task."""
+        if not self.lsp_client:
+            return
+        await asyncio.gather(*(self.lsp_client.did_close(path_str) for path_str in paths))
+
+    async def _batch_did_open(self, documents: List[Tuple[str, str]]):
+        """Sends 'didOpen' for several documents from a single task."""
+        if not self.lsp_client:
+            return
+        await asyncio.gather(*(self.lsp_client.did_open(path_str, content) for path_str, content in documents))
 
     def _handle_file_renamed(self, old_rel_path_str: str, new_rel_path_str: str):
         old_norm_path = self._resolve_and_normalize_path(old_rel_path_str)
         new_norm_path = self._resolve_and_normalize_path(new_rel_path_str)
         if not old_norm_path or not new_norm_path: return
+        self._materialize_tab(old_norm_path)
 
         if old_norm_path in self.editors:
             editor = self.editors.pop(old_norm_path)
             self.editors[new_norm_path] = editor
-            for i in range(self.tab_widget.count()):
-                if self.tab_widget.tabToolTip(i) == old_norm_path:
-                    new_tab_name = Path(new_norm_path).name
-                    self.tab_widget.setTabText(i, new_tab_name + ("*" if editor.is_dirty() else ""))
-                    self.tab_widget.setTabToolTip(i, new_norm_path)
-                    break
+            editor.setProperty("norm_path", new_norm_path)
+            self._tab_titles.pop(old_norm_path, None)
+            self._rel_paths.pop(old_norm_path, None)
+            self._remember_rel_path(new_norm_path)
+            index = self._path_to_index.pop(old_norm_path, -1)
+            if index == -1 or self.tab_widget.tabToolTip(index) != old_norm_path:
+                index = self.tab_widget.indexOf(editor)
+            if index != -1:
+                new_tab_name = Path(new_norm_path).name
+                self.tab_widget.setTabText(index, new_tab_name + ("*" if editor.is_dirty() else ""))
+                self.tab_widget.setTabToolTip(index, new_norm_path)
+                self._path_to_index[new_norm_path] = index
 
     def _handle_items_deleted(self, deleted_rel_paths: List[str]):
         paths_to_check = {self._resolve_and_normalize_path(p) for p in deleted_rel_paths}
+        paths_to_check.discard(None)
         tabs_to_close = []
-        for i in range(self.tab_widget.count()):
-            tab_path = self.tab_widget.tabToolTip(i)
-            if tab_path in paths_to_check:
-                tabs_to_close.append(i)
-        for i in sorted(tabs_to_close, reverse=True):
-            self.close_tab(i, force_close=True)
+        for norm_path in paths_to_check:
+            index = self._tab_index_for_path(norm_path)
+            if index != -1:
+                tabs_to_close.append(index)
+        self.close_tabs(tabs_to_close)
 
     def _handle_items_moved(self, moved_item_infos: List[Dict[str, str]]):
         for info in moved_item_infos:
             old_norm_path = self._resolve_and_normalize_path(info['old'])
             new_norm_path = self._resolve_and_normalize_path(info['new'])
             if not old_norm_path or not new_norm_path: continue
+            self._materialize_tab(old_norm_path)
 
             if old_norm_path in self.editors:
                 editor = self.editors.pop(old_norm_path)
                 self.editors[new_norm_path] = editor
-                for i in range(self.tab_widget.count()):
-                    if self.tab_widget.tabToolTip(i) == old_norm_path:
-                        self.tab_widget.setTabText(i, Path(new_norm_path).name + ("*" if editor.is_dirty() else ""))
-                        self.tab_widget.setTabToolTip(i, new_norm_path)
-                        break
+                editor.setProperty("norm_path", new_norm_path)
+                self._tab_titles.pop(old_norm_path, None)
+                self._rel_paths.pop(old_norm_path, None)
+                self._remember_rel_path(new_norm_path)
+                index = self._path_to_index.pop(old_norm_path, -1)
+                if index == -1 or self.tab_widget.tabToolTip(index) != old_norm_path:
+                    index = self.tab_widget.indexOf(editor)
+                if index != -1:
+                    self.tab_widget.setTabText(index, Path(new_norm_path).name + ("*" if editor.is_dirty() else ""))
+                    self.tab_widget.setTabToolTip(index, new_norm_path)
+                    self._path_to_index[new_norm_path] = index
 
     def _handle_items_added(self, added_item_infos: List[Dict[str, str]]):
         for info in added_item_infos:
@@ -2,8 +2,8 @@
 import logging
 from PySide6.QtWidgets import QWidget, QMessageBox, QPlainTextEdit, QTextEdit
 from PySide6.QtCore import Qt, QRect, QSize, Signal
-from PySide6.QtGui import QColor, QPainter, QTextFormat, QTextCursor, QFont, QKeySequence, QShortcut, QTextCharFormat
-from typing import Dict, List, Any
+from PySide6.QtGui import QColor, QPainter, QTextFormat, QTextCursor, QFont, QKeySequence, QShortcut, QTextCharFormat, QSyntaxHighlighter
+from typing import Dict, List, Any, Optional
 
 from src.ava.gui.components import Typography, Colors
 
@@ -53,6 +53,7 @@ class EnhancedCodeEditor(QPlainTextEdit):
         self.line_number_bg_color = Colors.SECONDARY_BG
         self._is_dirty = False
         self._original_content = ""
+        self.highlighter: Optional[QSyntaxHighlighter] = None
         self.setup_styling()
         self.setup_shortcuts()
         self.blockCountChanged.connect(self.update_line_number_area_width)
@@ -90,6 +91,12 @@ class EnhancedCodeEditor(QPlainTextEdit):
         self._is_dirty = False
         self.content_changed.emit()
 
+    def mark_saved(self, content: str):
+        """Records `content` as the saved state; the editor stays dirty if it has changed since."""
+        self._original_content = content
+        self._is_dirty = self.toPlainText() != content
+        self.content_changed.emit()
+
     def _on_content_changed(self):
         current_content = self.toPlainText()
         was_dirty = self._is_dirty
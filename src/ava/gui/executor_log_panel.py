@@ -1,7 +1,9 @@
 # src/ava/gui/executor_log_panel.py
 # NEW FILE
+from typing import List
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QTextEdit
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from src.ava.gui.components import Colors, Typography
 
@@ -11,6 +13,9 @@ class ExecutorLogPanel(QWidget):
     simulating a terminal view.
     """
 
+    FLUSH_INTERVAL_MS = 50
+    MAX_BLOCK_COUNT = 5000
+
     def __init__(self, parent: QWidget = None):
         super().__init__(parent)
         self.setObjectName("ExecutorLogPanel")
@@ -26,8 +31,15 @@ class ExecutorLogPanel(QWidget):
                 padding: 10px;
             }}
         """)
-        # Ensure scrollbar is always at the bottom when new text is added
-        self.log_view.textChanged.connect(self._scroll_to_bottom)
+        # Bound memory for long-running processes; the oldest lines are dropped first
+        self.log_view.document().setMaximumBlockCount(self.MAX_BLOCK_COUNT)
+
+        # Lines are buffered and appended in batches so noisy output doesn't relayout per line
+        self._pending_lines: List[str] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush_pending_lines)
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
@@ -35,13 +47,33 @@ class ExecutorLogPanel(QWidget):
         self.setLayout(layout)
 
     def append_output(self, line: str):
-        """Appends a new line of text to the log view."""
-        self.log_view.append(line)
+        """Queues a new line of text for the log view."""
+        self._pending_lines.append(line)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
 
     def clear_output(self):
         """Clears all text from the log view."""
+        self._pending_lines.clear()
+        self._flush_timer.stop()
         self.log_view.clear()
 
+    def _flush_pending_lines(self):
+        """Appends every queued line in one edit and scrolls to the bottom once."""
+        if not self._pending_lines:
+            return
+        lines, self._pending_lines = self._pending_lines, []
+        # One append per line keeps QTextEdit's markup detection scoped to that line;
+        # the edit block still lays the document out once for the whole batch
+        cursor = self.log_view.textCursor()
+        cursor.beginEditBlock()
+        try:
+            for line in lines:
+                self.log_view.append(line)
+        finally:
+            cursor.endEditBlock()
+        self._scroll_to_bottom()
+
     def _scroll_to_bottom(self):
         """Automatically scrolls the view to the last line."""
         scrollbar = self.log_view.verticalScrollBar()
@@ -2,11 +2,48 @@
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QComboBox, QMessageBox, QFrame
 )
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont, QStandardItem, QStandardItemModel
 
 from src.ava.gui.components import Colors, Typography, ModernButton, TemperatureSlider
 from src.ava.core.llm_client import LLMClient
 
+# Colors are static, so the per-role stylesheets are identical and built once at import
+_FRAME_QSS = f"""
+    QFrame {{
+        background-color: {Colors.PRIMARY_BG.name()};
+        border: 1px solid {Colors.BORDER_DEFAULT.name()};
+        border-radius: 8px;
+        padding: 10px;
+    }}
+"""
+_ROLE_TITLE_QSS = f"color: {Colors.TEXT_PRIMARY.name()}; border: none; padding: 0;"
+_MODEL_LABEL_QSS = f"color: {Colors.TEXT_PRIMARY.name()}; min-width: 80px;"
+_COMBO_QSS = f"""
+    QComboBox {{
+        background-color: {Colors.ELEVATED_BG.name()};
+        color: {Colors.TEXT_PRIMARY.name()};
+        border: 1px solid {Colors.BORDER_DEFAULT.name()};
+        border-radius: 4px;
+        padding: 5px;
+        min-width: 200px;
+    }}
+    QComboBox::drop-down {{ border: none; width: 20px; }}
+    QComboBox::down-arrow {{
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid {Colors.TEXT_SECONDARY.name()};
+        margin-right: 5px;
+    }}
+    QComboBox QAbstractItemView {{
+        background-color: {Colors.ELEVATED_BG.name()};
+        color: {Colors.TEXT_PRIMARY.name()};
+        selection-background-color: {Colors.ACCENT_BLUE.name()};
+        border: 1px solid {Colors.BORDER_DEFAULT.name()};
+    }}
+"""
+
 
 class ModelConfigurationDialog(QDialog):
     def __init__(self, llm_client: LLMClient, parent=None):
@@ -29,12 +66,13 @@ class ModelConfigurationDialog(QDialog):
         # Store UI components
         self.role_combos = {}
         self.temperature_sliders = {}
+        self._populated_models = None
+        # Every role combo lists the same models in the same order, so one index map serves all of them
+        self._model_key_index = {}
 
-        # Create role configuration sections
-        roles_to_configure = ["architect", "coder", "chat"]
-        for role in roles_to_configure:
-            role_frame = self._create_role_configuration_frame(role.title(), role)
-            main_layout.addWidget(role_frame)
+        # Role sections are built on first use; the dialog is created at startup but rarely opened
+        self._main_layout = main_layout
+        self._roles_insert_index = main_layout.count()
 
         # Buttons
         button_layout = QHBoxLayout()
@@ -50,19 +88,21 @@ class ModelConfigurationDialog(QDialog):
         button_layout.addWidget(apply_button)
         main_layout.addLayout(button_layout)
 
+    def _ensure_role_frames(self):
+        """Creates the role configuration sections the first time they are needed."""
+        if self.role_combos:
+            return
+        roles_to_configure = ["architect", "coder", "chat"]
+        for offset, role in enumerate(roles_to_configure):
+            role_frame = self._create_role_configuration_frame(role.title(), role)
+            self._main_layout.insertWidget(self._roles_insert_index + offset, role_frame)
+
     def _create_role_configuration_frame(self, role_display_name: str, role_key: str) -> QFrame:
         """
         Create a frame containing model selection and temperature controls for a role.
         """
         frame = QFrame()
-        frame.setStyleSheet(f"""
-            QFrame {{
-                background-color: {Colors.PRIMARY_BG.name()};
-                border: 1px solid {Colors.BORDER_DEFAULT.name()};
-                border-radius: 8px;
-                padding: 10px;
-            }}
-        """)
+        frame.setStyleSheet(_FRAME_QSS)
 
         frame_layout = QVBoxLayout(frame)
         frame_layout.setContentsMargins(15, 15, 15, 15)
@@ -70,40 +110,17 @@ class ModelConfigurationDialog(QDialog):
 
         role_title = QLabel(f"{role_display_name} Configuration")
         role_title.setFont(Typography.heading_small())
-        role_title.setStyleSheet(f"color: {Colors.TEXT_PRIMARY.name()}; border: none; padding: 0;")
+        role_title.setStyleSheet(_ROLE_TITLE_QSS)
         frame_layout.addWidget(role_title)
 
         model_layout = QHBoxLayout()
         model_label = QLabel("Model:")
         model_label.setFont(Typography.body())
-        model_label.setStyleSheet(f"color: {Colors.TEXT_PRIMARY.name()}; min-width: 80px;")
+        model_label.setStyleSheet(_MODEL_LABEL_QSS)
 
         model_combo = QComboBox()
         model_combo.setFont(Typography.body())
-        model_combo.setStyleSheet(f"""
-            QComboBox {{
-                background-color: {Colors.ELEVATED_BG.name()};
-                color: {Colors.TEXT_PRIMARY.name()};
-                border: 1px solid {Colors.BORDER_DEFAULT.name()};
-                border-radius: 4px;
-                padding: 5px;
-                min-width: 200px;
-            }}
-            QComboBox::drop-down {{ border: none; width: 20px; }}
-            QComboBox::down-arrow {{
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid {Colors.TEXT_SECONDARY.name()};
-                margin-right: 5px;
-            }}
-            QComboBox QAbstractItemView {{
-                background-color: {Colors.ELEVATED_BG.name()};
-                color: {Colors.TEXT_PRIMARY.name()};
-                selection-background-color: {Colors.ACCENT_BLUE.name()};
-                border: 1px solid {Colors.BORDER_DEFAULT.name()};
-            }}
-        """)
+        model_combo.setStyleSheet(_COMBO_QSS)
 
         model_layout.addWidget(model_label)
         model_layout.addWidget(model_combo)
@@ -121,12 +138,12 @@ class ModelConfigurationDialog(QDialog):
 
     def populate_settings(self):
         """Populate the dialog with current model and temperature settings."""
+        self._ensure_role_frames()
         current_assignments = self.llm_client.get_role_assignments()
         current_temperatures = self.llm_client.get_role_temperatures()
 
         for role, combo in self.role_combos.items():
-            current_model_key = current_assignments.get(role)
-            index = combo.findData(current_model_key)
+            index = self._model_key_index.get(current_assignments.get(role), -1)
             if index != -1:
                 combo.setCurrentIndex(index)
             elif combo.count() > 0:
@@ -138,32 +155,44 @@ class ModelConfigurationDialog(QDialog):
 
     async def populate_models_async(self):
         """Asynchronously fetch available models and populate dropdowns."""
+        self._ensure_role_frames()
         available_models = await self.llm_client.get_available_models()
         if not available_models:
             QMessageBox.warning(
                 self, "No Models Found",
                 "Could not find any configured or local AI models. Please check your .env file or Ollama server."
             )
+        # Reopening the dialog with an unchanged model list keeps the existing items
+        if available_models == self._populated_models:
+            return
+        self._populated_models = dict(available_models)
+        self._model_key_index = {key: index for index, key in enumerate(available_models)}
+
         for combo in self.role_combos.values():
-            combo.clear()
+            # Fill a detached model, then swap it in with one signal-free setModel call
+            # instead of an addItem (and currentIndexChanged) per model
+            model = QStandardItemModel(combo)
             for key, name in available_models.items():
-                combo.addItem(name, key)
+                item = QStandardItem(name)
+                item.setData(key, Qt.ItemDataRole.UserRole)
+                model.appendRow(item)
+            combo.blockSignals(True)
+            try:
+                combo.setModel(model)
+            finally:
+                combo.blockSignals(False)
 
     def apply_changes(self):
         """Apply the model and temperature changes."""
         try:
-            new_assignments = {}
-            for role, combo in self.role_combos.items():
-                if combo.currentData() is not None:
-                    new_assignments[role] = combo.currentData()
+            selected_models = {role: combo.currentData() for role, combo in self.role_combos.items()}
+            new_assignments = {role: key for role, key in selected_models.items() if key is not None}
 
             # Since reviewer is gone, let's just map architect to it for safety
             if 'architect' in new_assignments:
                 new_assignments['reviewer'] = new_assignments['architect']
 
-            new_temperatures = {}
-            for role, slider in self.temperature_sliders.items():
-                new_temperatures[role] = slider.get_temperature()
+            new_temperatures = {role: slider.get_temperature() for role, slider in self.temperature_sliders.items()}
 
             self.llm_client.set_role_assignments(new_assignments)
             self.llm_client.set_role_temperatures(new_temperatures)
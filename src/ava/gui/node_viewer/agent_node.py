@@ -1,75 +1,117 @@
 # src/ava/gui/node_viewer/agent_node.py
+import sys
+
 import qtawesome as qta
-from PySide6.QtCore import QRectF, Qt
-from PySide6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen
-from PySide6.QtWidgets import QGraphicsObject, QStyleOptionGraphicsItem, QWidget
-from typing import Optional, Any, List
+from PySide6.QtCore import QPointF, QRectF, Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QIcon, QPainter, QPainterPath, QPen, QPixmap
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem, QWidget
+from typing import Optional, Any, List, Dict, Tuple
 
 from src.ava.gui.components import Typography
 from .animated_connection import AnimatedConnection
 
 AGENT_NODE_WIDTH, AGENT_NODE_HEIGHT, AGENT_NODE_RADIUS, AGENT_ICON_SIZE = 150, 45, 22, 24
+PIXMAP_CACHE_LIMIT = 64
+
+_AGENT_RECT = QRectF(0, 0, AGENT_NODE_WIDTH, AGENT_NODE_HEIGHT)
+_AGENT_PATH = QPainterPath()
+_AGENT_PATH.addRoundedRect(_AGENT_RECT, AGENT_NODE_RADIUS, AGENT_NODE_RADIUS)
+# A circular or pill-shaped node for agents
+_AGENT_BG_BRUSH = QBrush(QColor("#21262d").lighter(110))
+_AGENT_BORDER_PEN = QPen(QColor("#30363d"), 1.5)
+_AGENT_TEXT_PEN = QPen(QColor("#f0f6fc"))
+_AGENT_ICON_RECT = QRectF(12, (AGENT_NODE_HEIGHT - AGENT_ICON_SIZE) / 2, AGENT_ICON_SIZE, AGENT_ICON_SIZE).toRect()
+_AGENT_TEXT_X = 12 + AGENT_ICON_SIZE + 8
+_AGENT_TEXT_RECT = QRectF(_AGENT_TEXT_X, 0, AGENT_NODE_WIDTH - _AGENT_TEXT_X - 8, AGENT_NODE_HEIGHT)
+_AGENT_ICON_COLOR = "#8b949e"
+_AGENT_ICON_KEYS = {
+    "Architect": "fa5s.drafting-compass",
+    "Coder": "fa5s.code",
+    "Rewriter": "fa5s.edit",
+    "Healer": "fa5s.heartbeat",
+    "Tester": "fa5s.vial",
+}
 
 
-class AgentNode(QGraphicsObject):
+class AgentNode(QGraphicsItem):
     """A graphical node representing an AI agent on the canvas."""
 
-    def __init__(self, agent_name: str, parent: Optional[QGraphicsObject] = None):
+    # Rendering is shared at class level across all agent nodes and zoom scales,
+    # keyed by (agent name, device scale).
+    _PIXMAP_CACHE: Dict[Tuple[str, float], QPixmap] = {}
+    _ICON_CACHE: Dict[Tuple[str, str], QIcon] = {}
+    # Built on first render, once a QApplication exists
+    _NAME_FONT: Optional[QFont] = None
+
+    def __init__(self, agent_name: str, parent: Optional[QGraphicsItem] = None):
         super().__init__(parent)
         self.agent_name = agent_name
         self.outgoing_connections: List['AnimatedConnection'] = []
 
-        self.setFlags(QGraphicsObject.GraphicsItemFlag.ItemIsMovable)
-        self.setCacheMode(QGraphicsObject.CacheMode.DeviceCoordinateCache)
+        self.setFlags(QGraphicsItem.GraphicsItemFlag.ItemIsMovable |
+                      QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
+        # No DeviceCoordinateCache: paint() already blits the shared pixmap, and a
+        # per-item cache would rasterize a second private copy for every new node.
         self.setToolTip(f"Agent: {self.agent_name}")
 
-        icon_map = {
-            "Architect": "fa5s.drafting-compass",
-            "Coder": "fa5s.code",
-            "Rewriter": "fa5s.edit",
-            "Healer": "fa5s.heartbeat",
-            "Tester": "fa5s.vial",
-        }
-        self.icon_key = icon_map.get(agent_name, "fa5s.robot")
+        # Interned so icon cache lookups hit on identity rather than comparing equal strings
+        self.icon_key = sys.intern(_AGENT_ICON_KEYS.get(agent_name, "fa5s.robot"))
 
     def add_connection(self, connection: 'AnimatedConnection') -> None:
         """Adds an outgoing connection to this agent node for tracking."""
         self.outgoing_connections.append(connection)
 
-    def itemChange(self, change: QGraphicsObject.GraphicsItemChange, value: Any) -> Any:
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
         """Updates connections when the agent node is moved."""
-        if change == QGraphicsObject.GraphicsItemChange.ItemPositionHasChanged:
-            for conn in self.outgoing_connections:
-                conn.update_path()
+        if change == QGraphicsItem.GraphicsItemChange.ItemPositionHasChanged:
+            AnimatedConnection.schedule_repath(self.outgoing_connections)
         return super().itemChange(change, value)
 
     def boundingRect(self) -> QRectF:
-        return QRectF(0, 0, AGENT_NODE_WIDTH, AGENT_NODE_HEIGHT)
+        return _AGENT_RECT
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: Optional[QWidget] = None):
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        node_rect = self.boundingRect()
+        device = painter.device()
+        dpr = device.devicePixelRatioF() if device else 1.0
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        # Quantize the scale so zooming does not produce an unbounded number of cache entries
+        scale = max(1.0, round(dpr * lod * 4) / 4)
+        painter.drawPixmap(QPointF(0, 0), self._get_pixmap(scale))
+
+    def _get_pixmap(self, scale: float) -> QPixmap:
+        """Returns the pre-rendered node, rasterizing it on first use at the given scale."""
+        key = (self.agent_name, scale)
+        pixmap = AgentNode._PIXMAP_CACHE.get(key)
+        if pixmap is None:
+            pixmap = QPixmap(int(AGENT_NODE_WIDTH * scale), int(AGENT_NODE_HEIGHT * scale))
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pixmap_painter = QPainter(pixmap)
+            self._render(pixmap_painter)
+            pixmap_painter.end()
+            if len(AgentNode._PIXMAP_CACHE) >= PIXMAP_CACHE_LIMIT:
+                AgentNode._PIXMAP_CACHE.clear()
+            AgentNode._PIXMAP_CACHE[key] = pixmap
+        return pixmap
 
-        # A circular or pill-shaped node for agents
-        bg_color = QColor("#21262d").lighter(110)
-        border_color = QColor("#30363d")
+    def _render(self, painter: QPainter):
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        path = QPainterPath()
-        path.addRoundedRect(node_rect, AGENT_NODE_RADIUS, AGENT_NODE_RADIUS)
-        painter.setPen(QPen(border_color, 1.5))
-        painter.fillPath(path, QBrush(bg_color))
-        painter.drawPath(path)
+        painter.setPen(_AGENT_BORDER_PEN)
+        painter.fillPath(_AGENT_PATH, _AGENT_BG_BRUSH)
+        painter.drawPath(_AGENT_PATH)
 
         # Draw Icon
-        icon_to_paint = qta.icon(self.icon_key, color="#8b949e")
-        icon_x = 12
-        icon_rect = QRectF(icon_x, (AGENT_NODE_HEIGHT - AGENT_ICON_SIZE) / 2, AGENT_ICON_SIZE, AGENT_ICON_SIZE)
-        icon_to_paint.paint(painter, icon_rect.toRect())
+        icon_cache_key = (self.icon_key, _AGENT_ICON_COLOR)
+        icon_to_paint = AgentNode._ICON_CACHE.get(icon_cache_key)
+        if icon_to_paint is None:
+            icon_to_paint = qta.icon(self.icon_key, color=_AGENT_ICON_COLOR)
+            AgentNode._ICON_CACHE[icon_cache_key] = icon_to_paint
+        icon_to_paint.paint(painter, _AGENT_ICON_RECT)
 
         # Draw Text
-        text_x = icon_rect.right() + 8
-        text_width = AGENT_NODE_WIDTH - text_x - 8
-        text_rect = QRectF(text_x, 0, text_width, AGENT_NODE_HEIGHT)
-        painter.setPen(QPen("#f0f6fc"))
-        painter.setFont(Typography.heading_small())
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self.agent_name)
\ No newline at end of file
+        painter.setPen(_AGENT_TEXT_PEN)
+        if AgentNode._NAME_FONT is None:
+            AgentNode._NAME_FONT = Typography.heading_small()
+        painter.setFont(AgentNode._NAME_FONT)
+        painter.drawText(_AGENT_TEXT_RECT, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self.agent_name)
\ No newline at end of file
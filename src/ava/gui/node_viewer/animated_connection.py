@@ -1,17 +1,40 @@
 # src/ava/gui/node_viewer/animated_connection.py
-import math
-from typing import Optional
+from typing import Any, Iterable, Optional, Set, Tuple
 
-from PySide6.QtCore import QPointF, Qt, QTimer
+from PySide6.QtCore import QPointF, QRectF, Qt, QTimer
 from PySide6.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen, QPolygonF
 from PySide6.QtWidgets import (
-    QGraphicsObject,
+    QGraphicsItem,
     QGraphicsPathItem,
     QStyleOptionGraphicsItem,
     QWidget,
 )
 
 from src.ava.gui.components import Colors
+from .connection_geometry import compute_connection_geometry
+
+
+def _connection_pen(color: QColor, width: float) -> QPen:
+    pen = QPen(color, width, Qt.PenStyle.SolidLine)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    return pen
+
+
+# Shared by every idle connection; QPen is implicitly shared, so setPen() does not copy it
+_BASE_COLOR = QColor(Colors.BORDER_DEFAULT)
+_INACTIVE_PEN = _connection_pen(_BASE_COLOR, 2.0)
+_INACTIVE_ARROW_BRUSH = QBrush(_BASE_COLOR)
+
+
+def _pack_rgb(color: QColor) -> int:
+    return (color.red() << 16) | (color.green() << 8) | color.blue()
+
+
+_BASE_PACKED = _pack_rgb(_BASE_COLOR)
+# Below this zoom the arrowhead is a couple of pixels across, so only the line is drawn
+ARROW_MIN_LOD = 0.3
+# Half the widest pulse pen, added around the curve and arrowhead
+_DIRTY_MARGIN = 2.0
 
 
 class AnimatedConnection(QGraphicsPathItem):
@@ -20,28 +43,47 @@ class AnimatedConnection(QGraphicsPathItem):
     to indicate AI agent activity.
     """
 
-    def __init__(self, start_node: QGraphicsObject, end_node: QGraphicsObject):
+    # One timer drives every pulsing connection; a connection is in the set
+    # while it is active and visible.
+    _pulse_timer: Optional[QTimer] = None
+    _pulsing: Set['AnimatedConnection'] = set()
+    # Connections whose nodes moved since the last flush. They are repathed once per
+    # event-loop pass, so an edge between two dragged nodes is only rebuilt once.
+    _dirty: Set['AnimatedConnection'] = set()
+
+    def __init__(self, start_node: QGraphicsItem, end_node: QGraphicsItem):
         super().__init__()
         self.start_node = start_node
         self.end_node = end_node
+        # Node sizes never change, so the anchor offsets are resolved once:
+        # the middle-right of the start node and the middle-left of the end node.
+        # Kept as plain floats so repathing does not allocate QPointFs until the Qt calls.
+        start_rect = start_node.boundingRect()
+        self._start_anchor_x = start_rect.width()
+        self._start_anchor_y = start_rect.height() / 2
+        self._end_anchor_y = end_node.boundingRect().height() / 2
 
         # --- State ---
         self._is_active = False
-        self._base_color = QColor(Colors.BORDER_DEFAULT)
-        self._glow_color = self._base_color
+        self._glow_packed = _BASE_PACKED
         self._current_pen_width = 2.0
         self._pulse_direction = 1  # 1 for increasing, -1 for decreasing
 
         self.arrow_head = QPolygonF()
+        self._arrow_brush = _INACTIVE_ARROW_BRUSH
+        # Mutated in place on every pulse tick instead of being reallocated
+        self._pulse_color = QColor(_BASE_COLOR)
+        self._pulse_pen = _connection_pen(_BASE_COLOR, 2.0)
+        self._pulse_brush = QBrush(_BASE_COLOR)
+        # Endpoints (sx, sy, ex, ey) the current path and arrowhead were built for
+        self._last_endpoints: Optional[Tuple[float, float, float, float]] = None
+        # The curve plus the arrowhead at the widest pulse pen, rebuilt with the path. It is both
+        # the item's bounding rect and the area a pulse tick repaints.
+        self._dirty_rect = QRectF()
         self.setZValue(-1)  # Draw behind nodes
 
-        # --- Animation Timer ---
-        self.animation_timer = QTimer()
-        self.animation_timer.setInterval(50)  # ~20 FPS is fine for a pulse
-        self.animation_timer.timeout.connect(self._update_pulse)
-
         # Initial setup
-        self.deactivate()
+        self.setPen(_INACTIVE_PEN)
         self.update_path()
 
     def activate(self, color: QColor):
@@ -49,24 +91,92 @@ class AnimatedConnection(QGraphicsPathItem):
         if self._is_active:
             return
         self._is_active = True
-        self._glow_color = color
+        self._glow_packed = _pack_rgb(color)
         self._pulse_direction = 1
-        self.animation_timer.start()
+        if self.isVisible():
+            AnimatedConnection._start_pulsing(self)
+
+    @classmethod
+    def _start_pulsing(cls, connection: 'AnimatedConnection'):
+        cls._pulsing.add(connection)
+        if cls._pulse_timer is None:
+            cls._pulse_timer = QTimer()
+            cls._pulse_timer.setInterval(50)  # ~20 FPS is fine for a pulse
+            cls._pulse_timer.timeout.connect(cls._pulse_all)
+        if not cls._pulse_timer.isActive():
+            cls._pulse_timer.start()
+
+    @classmethod
+    def _stop_pulsing(cls, connection: 'AnimatedConnection'):
+        cls._pulsing.discard(connection)
+        if not cls._pulsing and cls._pulse_timer:
+            cls._pulse_timer.stop()
+
+    @classmethod
+    def _pulse_all(cls):
+        for connection in list(cls._pulsing):
+            connection._update_pulse()
+
+    @classmethod
+    def schedule_repath(cls, connections: Iterable['AnimatedConnection']) -> None:
+        """Queues connections to be repathed on the next event-loop pass."""
+        if not connections:
+            return
+        if not cls._dirty:
+            QTimer.singleShot(0, cls._flush_repaths)
+        cls._dirty.update(connections)
+
+    @classmethod
+    def discard_pending_repaths(cls) -> None:
+        """Drops queued repaths, e.g. before the scene deletes the connections."""
+        cls._dirty.clear()
+
+    @classmethod
+    def _flush_repaths(cls):
+        dirty, cls._dirty = cls._dirty, set()
+        # Resolve the method once rather than per connection
+        update_path = cls.update_path
+        for connection in dirty:
+            update_path(connection)
+
+    def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
+        # Hidden lines (collapsed subtrees) or lines taken out of the scene do not need to pulse
+        if change == QGraphicsItem.GraphicsItemChange.ItemVisibleHasChanged:
+            if value and self._is_active:
+                AnimatedConnection._start_pulsing(self)
+            else:
+                AnimatedConnection._stop_pulsing(self)
+        elif change == QGraphicsItem.GraphicsItemChange.ItemSceneHasChanged and value is None:
+            AnimatedConnection._stop_pulsing(self)
+        return super().itemChange(change, value)
+
+    def _is_on_screen(self) -> bool:
+        scene = self.scene()
+        if scene is None:
+            return False
+        rect = self.sceneBoundingRect()
+        for view in scene.views():
+            if view.isVisible() and view.mapToScene(view.viewport().rect()).boundingRect().intersects(rect):
+                return True
+        return False
 
     def deactivate(self):
         """Stops the animation and returns the line to its default state."""
+        # Only a pulsing line paints with the pulse pen, so an idle line has nothing to reset
+        if not self._is_active:
+            return
         self._is_active = False
-        self.animation_timer.stop()
+        AnimatedConnection._stop_pulsing(self)
         self._current_pen_width = 2.0
-        # Update pen to the inactive state
-        pen = QPen(self._base_color, self._current_pen_width, Qt.PenStyle.SolidLine)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        self.setPen(pen)
-        self.update()
+        # Start the next activation from the idle look until its first pulse tick
+        self._pulse_pen.setColor(_BASE_COLOR)
+        self._pulse_pen.setWidthF(self._current_pen_width)
+        self._arrow_brush = _INACTIVE_ARROW_BRUSH
+        self.update(self._dirty_rect)
 
     def _update_pulse(self):
-        """The core animation loop called by the QTimer."""
-        if not self._is_active:
+        """Advances the pulse by one frame; called from the shared pulse timer."""
+        if not self._is_active or not self._is_on_screen():
             return
 
         # Animate pen width for a "breathing" effect
@@ -86,62 +196,82 @@ class AnimatedConnection(QGraphicsPathItem):
         # This gives a nice effect where it gets brighter as it gets thicker
         width_ratio = (self._current_pen_width - 2.0) / 2.0  # a value from 0.0 to 1.0
 
-        r = int(self._base_color.red() * (1 - width_ratio) + self._glow_color.red() * width_ratio)
-        g = int(self._base_color.green() * (1 - width_ratio) + self._glow_color.green() * width_ratio)
-        b = int(self._base_color.blue() * (1 - width_ratio) + self._glow_color.blue() * width_ratio)
+        # Lerp all three channels on packed 0xRRGGBB ints: red and blue share one multiply, green the other
+        glow_weight = int(width_ratio * 256)
+        base_weight = 256 - glow_weight
+        glow = self._glow_packed
+        red_blue = (((_BASE_PACKED & 0xFF00FF) * base_weight + (glow & 0xFF00FF) * glow_weight) >> 8) & 0xFF00FF
+        green = (((_BASE_PACKED & 0x00FF00) * base_weight + (glow & 0x00FF00) * glow_weight) >> 8) & 0x00FF00
+        self._pulse_color.setRgb(red_blue >> 16, green >> 8, red_blue & 0xFF)
 
-        pulse_color = QColor(r, g, b)
+        # The item's own pen is left alone: setPen() would re-index the item and repaint all of it.
+        # paint() draws with the pulse pen instead, and the bounding rect already fits its widest stroke.
+        self._pulse_pen.setColor(self._pulse_color)
+        self._pulse_pen.setWidthF(self._current_pen_width)
+        self._pulse_brush.setColor(self._pulse_color)
+        self._arrow_brush = self._pulse_brush
 
-        pen = QPen(pulse_color, self._current_pen_width, Qt.PenStyle.SolidLine)
-        pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-        self.setPen(pen)
-
-        # This will trigger a repaint of the item
-        self.update()
+        # Only the curve and arrowhead changed colour, so repaint just that area
+        self.update(self._dirty_rect)
 
     def update_path(self) -> None:
         """Recalculates the curve of the line when a connected node moves."""
-        # Get connection points from the middle-right of the start node
-        # and middle-left of the end node.
-        start_pos = self.start_node.pos() + QPointF(self.start_node.boundingRect().width(),
-                                                    self.start_node.boundingRect().height() / 2)
-        end_pos = self.end_node.pos() + QPointF(0, self.end_node.boundingRect().height() / 2)
+        start_node, end_node = self.start_node, self.end_node
+        self._rebuild_path(start_node.x() + self._start_anchor_x, start_node.y() + self._start_anchor_y,
+                           end_node.x(), end_node.y() + self._end_anchor_y)
 
-        # Create a nice Bezier curve for the path
-        path = QPainterPath(start_pos)
-        offset = (end_pos.x() - start_pos.x()) * 0.5
-        c1 = QPointF(start_pos.x() + offset, start_pos.y())
-        c2 = QPointF(end_pos.x() - offset, end_pos.y())
-        path.cubicTo(c1, c2, end_pos)
+    def _rebuild_path(self, sx: float, sy: float, ex: float, ey: float) -> None:
+        # Full relayout passes repath every connection; skip the curve and arrowhead rebuild if nothing moved
+        endpoints = (sx, sy, ex, ey)
+        last = self._last_endpoints
+        if endpoints == last:
+            return
+        self._last_endpoints = endpoints
 
-        self.setPath(path)
-        self._update_arrowhead(path, end_pos)
+        if last is not None:
+            dx, dy = sx - last[0], sy - last[1]
+            if ex - last[2] == dx and ey - last[3] == dy:
+                # Both nodes moved together (multi-node drag): the curve keeps its shape, so shift it
+                path = self.path()
+                path.translate(dx, dy)
+                self.setPath(path)
+                self._dirty_rect.translate(dx, dy)
+                self.arrow_head.translate(dx, dy)
+                return
 
-    def _update_arrowhead(self, path: QPainterPath, end_point: QPointF) -> None:
-        """Calculates the shape of the arrowhead."""
-        # We want the arrow to point in the direction of the line's end
-        angle_rad = math.radians(180 - path.angleAtPercent(1.0))
-        arrow_size = 10.0
+        c1x, c1y, c2x, c2y, p1x, p1y, p2x, p2y = compute_connection_geometry(sx, sy, ex, ey)
 
-        # Calculate the two points of the arrowhead based on the angle and size
-        arrow_p1 = end_point + QPointF(math.cos(angle_rad - math.pi / 6) * arrow_size,
-                                       math.sin(angle_rad - math.pi / 6) * arrow_size)
-        arrow_p2 = end_point + QPointF(math.cos(angle_rad + math.pi / 6) * arrow_size,
-                                       math.sin(angle_rad + math.pi / 6) * arrow_size)
+        # Create a nice Bezier curve for the path
+        path = QPainterPath()
+        path.moveTo(sx, sy)
+        path.cubicTo(c1x, c1y, c2x, c2y, ex, ey)
+        self.setPath(path)
 
         self.arrow_head.clear()
-        self.arrow_head.append(end_point)
-        self.arrow_head.append(arrow_p1)
-        self.arrow_head.append(arrow_p2)
+        self.arrow_head.append(QPointF(ex, ey))
+        self.arrow_head.append(QPointF(p1x, p1y))
+        self.arrow_head.append(QPointF(p2x, p2y))
+
+        # The arrowhead can reach well past the curve when the nodes are close together horizontally
+        self._dirty_rect = path.boundingRect().united(self.arrow_head.boundingRect()).adjusted(
+            -_DIRTY_MARGIN, -_DIRTY_MARGIN, _DIRTY_MARGIN, _DIRTY_MARGIN)
+
+    def boundingRect(self) -> QRectF:
+        # Covers the arrowhead and the widest pulse pen, which the path item's own rect does not
+        return self._dirty_rect
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: Optional[QWidget] = None) -> None:
         """Draws the line and the arrowhead."""
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # The parent class draws the line itself
-        super().paint(painter, option, widget)
+        painter.setPen(self._pulse_pen if self._is_active else self.pen())
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPath(self.path())
+
+        if option.levelOfDetailFromTransform(painter.worldTransform()) < ARROW_MIN_LOD:
+            return
 
         # We manually draw the arrowhead
-        painter.setBrush(QBrush(self.pen().color()))
+        painter.setBrush(self._arrow_brush)
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawPolygon(self.arrow_head)
\ No newline at end of file
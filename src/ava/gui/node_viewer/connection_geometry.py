@@ -0,0 +1,50 @@
+# src/ava/gui/node_viewer/connection_geometry.py
+import math
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+ARROW_SIZE = 10.0
+# The arrowhead's sides are the backward tangent rotated by +/-30 degrees
+_COS30 = math.cos(math.pi / 6)
+_SIN30 = math.sin(math.pi / 6)
+
+
+def _compute_connection_geometry(sx: float, sy: float, ex: float, ey: float) -> tuple:
+    """
+    Returns the Bezier control points and arrowhead corners for a connection
+    from (sx, sy) to (ex, ey) as (c1x, c1y, c2x, c2y, p1x, p1y, p2x, p2y).
+    Plain floats in and out, so it can be compiled by numba when available.
+    """
+    offset = (ex - sx) * 0.5
+    c1x = sx + offset
+    c2x = ex - offset
+
+    # The arrow follows the end tangent (c2 -> end)
+    dx = ex - c2x
+    dy = 0.0
+    if dx == 0.0:
+        # Vertically stacked nodes collapse the curve into a straight chord
+        dx = ex - sx
+        dy = ey - sy
+    length = math.sqrt(dx * dx + dy * dy)
+    if length == 0.0:
+        dx = 1.0
+        length = 1.0
+    # Unit vector pointing back along the line, scaled to the arrow size
+    ux = -dx * ARROW_SIZE / length
+    uy = -dy * ARROW_SIZE / length
+
+    return (c1x, sy, c2x, ey,
+            ex + ux * _COS30 + uy * _SIN30, ey + uy * _COS30 - ux * _SIN30,
+            ex + ux * _COS30 - uy * _SIN30, ey + uy * _COS30 + ux * _SIN30)
+
+
+if njit is not None:
+    compute_connection_geometry = njit(cache=True, fastmath=True)(_compute_connection_geometry)
+    # Compile at import (app start) rather than on the first drag frame
+    compute_connection_geometry(0.0, 0.0, 1.0, 1.0)
+else:
+    compute_connection_geometry = _compute_connection_geometry
@@ -1,16 +1,44 @@
 # src/ava/gui/node_viewer/project_actions_sidebar.py
 # NEW FILE
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QSpacerItem, QSizePolicy
 from PySide6.QtCore import Qt, Signal
-import qtawesome as qta
+from PySide6.QtGui import QIcon
 
 from src.ava.gui.components import Colors, Typography, ModernButton
 from src.ava.core.event_bus import EventBus
 from src.ava.core.project_manager import ProjectManager
 
+# The palette is static, so the sidebar's colors and stylesheets are formatted once at import
+_TEXT_PRIMARY_HEX = Colors.TEXT_PRIMARY.name()
+_SIDEBAR_QSS = f"background-color: {Colors.SECONDARY_BG.name()};"
+_TITLE_QSS = f"color: {_TEXT_PRIMARY_HEX}; padding-bottom: 5px;"
+_SEPARATOR_QSS = f"border-top: 1px solid {Colors.BORDER_DEFAULT.name()};"
+_STATUS_QSS = f"color: {Colors.TEXT_SECONDARY.name()};"
+_HEAL_BUTTON_QSS = f"""
+    QPushButton {{
+        background-color: {Colors.ACCENT_RED.name()};
+        color: {_TEXT_PRIMARY_HEX};
+        border: 1px solid {Colors.BORDER_DEFAULT.name()};
+        border-radius: 6px;
+        padding: 5px 15px;
+    }}
+    QPushButton:hover {{
+        background-color: {Colors.ACCENT_RED.lighter(110).name()};
+    }}
+"""
+
+
+@lru_cache(maxsize=32)
+def _get_icon(name: str, color_hex: str) -> QIcon:
+    """Builds a qtawesome icon once and shares it across every sidebar instance."""
+    import qtawesome as qta
+    return qta.icon(name, color=color_hex)
+
 
 class ProjectActionsSidebar(QWidget):
     """
@@ -24,7 +52,7 @@ class ProjectActionsSidebar(QWidget):
         self.project_manager = project_manager
 
         self.setFixedWidth(250)
-        self.setStyleSheet(f"background-color: {Colors.SECONDARY_BG.name()};")
+        self.setStyleSheet(_SIDEBAR_QSS)
 
         # --- Main Layout ---
         main_layout = QVBoxLayout(self)
@@ -35,17 +63,15 @@ class ProjectActionsSidebar(QWidget):
         # --- Title ---
         title_label = QLabel("Project Actions")
         title_label.setFont(Typography.get_font(14, 800))  # Heavier weight
-        title_label.setStyleSheet(f"color: {Colors.TEXT_PRIMARY.name()}; padding-bottom: 5px;")
+        title_label.setStyleSheet(_TITLE_QSS)
         main_layout.addWidget(title_label)
 
         # --- Action Buttons ---
         self.run_program_button = ModernButton("Run Program", "primary")
-        self.run_program_button.setIcon(qta.icon("fa5s.play", color=Colors.TEXT_PRIMARY.name()))
         self.run_program_button.clicked.connect(self._on_run_program)
         main_layout.addWidget(self.run_program_button)
 
         self.run_tests_button = ModernButton("Run Tests", "secondary")
-        self.run_tests_button.setIcon(qta.icon("fa5s.vial", color=Colors.TEXT_PRIMARY.name()))
         self.run_tests_button.clicked.connect(self._on_run_tests)
         main_layout.addWidget(self.run_tests_button)
 
@@ -53,31 +79,19 @@ class ProjectActionsSidebar(QWidget):
         separator = QFrame()
         separator.setFrameShape(QFrame.Shape.HLine)
         separator.setFrameShadow(QFrame.Shadow.Sunken)
-        separator.setStyleSheet(f"border-top: 1px solid {Colors.BORDER_DEFAULT.name()};")
+        separator.setStyleSheet(_SEPARATOR_QSS)
         main_layout.addWidget(separator)
 
         # --- Status Display ---
         self.status_label = QLabel("Ready")
         self.status_label.setFont(Typography.body())
-        self.status_label.setStyleSheet(f"color: {Colors.TEXT_SECONDARY.name()};")
+        self.status_label.setStyleSheet(_STATUS_QSS)
         self.status_label.setWordWrap(True)
         main_layout.addWidget(self.status_label)
 
         # --- Heal Button (Initially Hidden) ---
         self.heal_button = ModernButton("Heal with AI", "primary")
-        self.heal_button.setIcon(qta.icon("fa5s.heartbeat", color=Colors.TEXT_PRIMARY.name()))
-        self.heal_button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {Colors.ACCENT_RED.name()};
-                color: {Colors.TEXT_PRIMARY.name()};
-                border: 1px solid {Colors.BORDER_DEFAULT.name()};
-                border-radius: 6px;
-                padding: 5px 15px;
-            }}
-            QPushButton:hover {{
-                background-color: {Colors.ACCENT_RED.lighter(110).name()};
-            }}
-        """)
+        self.heal_button.setStyleSheet(_HEAL_BUTTON_QSS)
         self.heal_button.clicked.connect(self._on_heal)
         self.heal_button.hide()
         main_layout.addWidget(self.heal_button)
@@ -86,6 +100,16 @@ class ProjectActionsSidebar(QWidget):
 
         # Internal state to track the last failed command
         self._last_failed_command_type: Optional[str] = None  # "run" or "test"
+        # Icons are resolved on first show so constructing the sidebar doesn't touch qtawesome
+        self._icons_loaded = False
+
+    def showEvent(self, event):
+        if not self._icons_loaded:
+            self._icons_loaded = True
+            self.run_program_button.setIcon(_get_icon("fa5s.play", _TEXT_PRIMARY_HEX))
+            self.run_tests_button.setIcon(_get_icon("fa5s.vial", _TEXT_PRIMARY_HEX))
+            self.heal_button.setIcon(_get_icon("fa5s.heartbeat", _TEXT_PRIMARY_HEX))
+        super().showEvent(event)
 
     def _on_run_program(self):
         self.hide_heal_button()
@@ -121,15 +145,24 @@ class ProjectActionsSidebar(QWidget):
 
     def _find_entry_point(self) -> Optional[Path]:
         """Finds a common entry point file like main.py or app.py."""
-        if not self.project_manager.active_project_path:
+        root = self.project_manager.active_project_path
+        if not root:
             return None
 
+        # One directory listing instead of a stat per candidate; earlier candidates win.
+        # Names are compared with normcase and any existing entry counts, as Path.exists() did.
         common_files = ["main.py", "app.py"]
-        for file in common_files:
-            path = self.project_manager.active_project_path / file
-            if path.exists():
-                return path
-        return None
+        ranks = {os.path.normcase(name): rank for rank, name in enumerate(common_files)}
+        best_rank = len(common_files)
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    rank = ranks.get(os.path.normcase(entry.name))
+                    if rank is not None and rank < best_rank and (entry.is_file() or entry.is_dir()):
+                        best_rank = rank
+        except OSError:
+            return None
+        return root / common_files[best_rank] if best_rank < len(common_files) else None
 
     def update_on_command_finish(self, exit_code: int):
         """Called when a command from this sidebar finishes."""
@@ -1,26 +1,75 @@
 # src/ava/gui/node_viewer/project_node.py
 import logging
-from typing import Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import qtawesome as qta
-from PySide6.QtCore import QRectF, Qt, Signal, QPointF
-from PySide6.QtGui import QBrush, QColor, QFontMetrics, QPainter, QPainterPath, QPen, QMouseEvent, QPalette
-from PySide6.QtWidgets import QGraphicsItem, QGraphicsObject, QStyleOptionGraphicsItem, QWidget, QStyle, \
+from PySide6.QtCore import QLine, QPointF, QRectF, QSize, Qt
+from PySide6.QtGui import QBrush, QColor, QFont, QFontMetrics, QIcon, QPainter, QPainterPath, QPen, QMouseEvent, QPixmap
+from PySide6.QtWidgets import QGraphicsItem, QStyleOptionGraphicsItem, QWidget, \
     QGraphicsSceneHoverEvent
 
-from src.ava.gui.components import Typography
+from src.ava.gui.components import Colors, Typography
 from .animated_connection import AnimatedConnection
 
 logger = logging.getLogger(__name__)
 NODE_WIDTH, NODE_HEIGHT, NODE_RADIUS, ICON_SIZE = 150, 45, 8, 20
 TOGGLE_BOX_SIZE = 12
-
-
-class ProjectNode(QGraphicsObject):
+# Item-space cache resolution; 2x the node size keeps text crisp up to 2x zoom and on HiDPI
+NODE_CACHE_SIZE = QSize(NODE_WIDTH * 2, NODE_HEIGHT * 2)
+BODY_PIXMAP_CACHE_LIMIT = 32
+
+# Node geometry is fixed, so the paint/hit-test rects are computed once here
+_NODE_RECT = QRectF(0, 0, NODE_WIDTH, NODE_HEIGHT)
+_TOGGLE_RECT = QRectF(5, (NODE_HEIGHT - TOGGLE_BOX_SIZE) / 2, TOGGLE_BOX_SIZE, TOGGLE_BOX_SIZE)
+_ICON_RECT = QRectF(22, (NODE_HEIGHT - ICON_SIZE) / 2, ICON_SIZE, ICON_SIZE).toRect()
+_TEXT_X = 22 + ICON_SIZE + 8
+_TEXT_WIDTH = NODE_WIDTH - _TEXT_X - 8
+_TEXT_RECT = QRectF(_TEXT_X, 0, _TEXT_WIDTH, NODE_HEIGHT)
+_NODE_PATH = QPainterPath()
+_NODE_PATH.addRoundedRect(_NODE_RECT, NODE_RADIUS, NODE_RADIUS)
+_toggle_center = _TOGGLE_RECT.center()
+_TOGGLE_H_LINE = QLine(int(_toggle_center.x() - 3), int(_toggle_center.y()),
+                       int(_toggle_center.x() + 3), int(_toggle_center.y()))
+_TOGGLE_V_LINE = QLine(int(_toggle_center.x()), int(_toggle_center.y() - 3),
+                       int(_toggle_center.x()), int(_toggle_center.y() + 3))
+# Icons are only resolved (and cached) on first paint; nodes just carry the key
+_ICON_KEYS = {
+    'folder': "fa5s.folder",
+    'file': "fa5s.file-code",
+    'class': "fa5s.cubes",
+    'function': "fa5s.cogs"
+}
+
+
+def _node_style(bg_color: QColor, border_color: QColor, text_color: QColor) -> tuple:
+    """(background brush, border pen, text pen, toggle pen, icon color) for one visual state."""
+    return QBrush(bg_color), QPen(border_color, 1.5), QPen(text_color), QPen(text_color, 1.5), text_color.name()
+
+
+_NORMAL_STYLE = _node_style(Colors.ELEVATED_BG, Colors.BORDER_DEFAULT, Colors.TEXT_SECONDARY)
+_HOVER_STYLE = _node_style(Colors.ELEVATED_BG.lighter(120), Colors.BORDER_DEFAULT, Colors.TEXT_SECONDARY)
+# Dark text for better contrast on orange
+_SELECTED_STYLE = _node_style(Colors.ACCENT_BLUE, Colors.ACCENT_BLUE.lighter(130), Colors.PRIMARY_BG)
+_STYLES = {"normal": _NORMAL_STYLE, "hover": _HOVER_STYLE, "selected": _SELECTED_STYLE}
+# Indexed as [selected][hovered]; selection wins over hover
+_STATE_BY_FLAGS = (("normal", "hover"), ("selected", "selected"))
+
+
+class ProjectNode(QGraphicsItem):
     """
     A graphical node representing a file, folder, class, or function.
     It handles its own drawing, state changes, and notifies connections when it moves.
+    It is a plain QGraphicsItem (no QObject per node); toggle requests go through a callback.
     """
-    toggle_requested = Signal()
+
+    # qtawesome builds a new QIcon per call; nodes share one per (icon key, color)
+    _ICON_CACHE: Dict[Tuple[str, str], QIcon] = {}
+    # Label font and metrics are the same for every node; built on first use, once a QApplication exists
+    _LABEL_FONT: Optional[QFont] = None
+    _LABEL_METRICS: Optional[QFontMetrics] = None
+    # The rounded body only depends on the visual state, so it is rasterized once per (state, scale)
+    _BODY_PIXMAPS: Dict[Tuple[str, float], QPixmap] = {}
+    # Icons rasterized at the paint scale, so paint() blits instead of asking the icon engine each time
+    _ICON_PIXMAPS: Dict[Tuple[str, str, float], QPixmap] = {}
 
     def __init__(self, name: str, path: str, node_type: str, full_code: str = "",
                  parent: Optional[QGraphicsItem] = None) -> None:
@@ -29,35 +78,102 @@ class ProjectNode(QGraphicsObject):
         self.path = path
         self.node_type = node_type  # 'folder', 'file', 'class', 'function'
         self.full_code = full_code
+        # The name and text rect are fixed, so the label is elided here and in set_name() only
+        self._elided_name = self._elide(name)
         self._is_hovered = False
+        # Set while the visualizer moves nodes in a batch and repaths their connections itself
+        self.defer_connection_updates = False
 
         self.is_expanded = True
+        # Called with this node when its [+] / [-] box is clicked
+        self.on_toggle_requested: Optional[Callable[['ProjectNode'], None]] = None
         self.child_nodes: List['ProjectNode'] = []
         self.parent_node: Optional['ProjectNode'] = None
 
         self.incoming_connections: List['AnimatedConnection'] = []
         self.outgoing_connections: List['AnimatedConnection'] = []
 
-        self.setFlags(QGraphicsItem.ItemIsMovable | QGraphicsItem.ItemIsSelectable)
+        self.setFlags(QGraphicsItem.ItemIsMovable | QGraphicsItem.ItemIsSelectable |
+                      QGraphicsItem.ItemSendsGeometryChanges)
         self.setAcceptHoverEvents(True)
-        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+        # Cached in item coordinates so zooming blits the existing pixmap instead of re-rasterizing every node.
+        # Moving only translates that pixmap, so the cache stays valid for the whole drag.
+        self.setCacheMode(QGraphicsItem.CacheMode.ItemCoordinateCache, NODE_CACHE_SIZE)
         self.setToolTip(f"Type: {node_type.title()}\nPath: {self.path}")
 
-        icon_map = {
-            'folder': "fa5s.folder",
-            'file': "fa5s.file-code",
-            'class': "fa5s.cubes",
-            'function': "fa5s.cogs"
-        }
-        self.icon_key = icon_map.get(self.node_type, "fa5s.question-circle")
-        self.icon = qta.icon(self.icon_key, color=QColor("#8b949e"))
+        self.icon_key = _ICON_KEYS.get(self.node_type, "fa5s.question-circle")
+
+    @classmethod
+    def _icon(cls, icon_key: str, color: str) -> QIcon:
+        key = (icon_key, color)
+        icon = cls._ICON_CACHE.get(key)
+        if icon is None:
+            icon = qta.icon(icon_key, color=color)
+            cls._ICON_CACHE[key] = icon
+        return icon
+
+    @classmethod
+    def _icon_pixmap(cls, icon_key: str, color: str, scale: float) -> QPixmap:
+        key = (icon_key, color, scale)
+        pixmap = cls._ICON_PIXMAPS.get(key)
+        if pixmap is None:
+            pixel_size = int(ICON_SIZE * scale)
+            pixmap = cls._icon(icon_key, color).pixmap(pixel_size, pixel_size)
+            pixmap.setDevicePixelRatio(scale)
+            if len(cls._ICON_PIXMAPS) >= BODY_PIXMAP_CACHE_LIMIT:
+                cls._ICON_PIXMAPS.clear()
+            cls._ICON_PIXMAPS[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def _body_pixmap(cls, state: str, scale: float) -> QPixmap:
+        key = (state, scale)
+        pixmap = cls._BODY_PIXMAPS.get(key)
+        if pixmap is None:
+            bg_brush, border_pen = _STYLES[state][:2]
+            pixmap = QPixmap(int(NODE_WIDTH * scale), int(NODE_HEIGHT * scale))
+            pixmap.setDevicePixelRatio(scale)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            pixmap_painter.setPen(border_pen)
+            pixmap_painter.fillPath(_NODE_PATH, bg_brush)
+            pixmap_painter.drawPath(_NODE_PATH)
+            pixmap_painter.end()
+            if len(cls._BODY_PIXMAPS) >= BODY_PIXMAP_CACHE_LIMIT:
+                cls._BODY_PIXMAPS.clear()
+            cls._BODY_PIXMAPS[key] = pixmap
+        return pixmap
+
+    @classmethod
+    def _label_font(cls) -> QFont:
+        if cls._LABEL_FONT is None:
+            cls._LABEL_FONT = Typography.body()
+            cls._LABEL_METRICS = QFontMetrics(cls._LABEL_FONT)
+        return cls._LABEL_FONT
+
+    @classmethod
+    def _elide(cls, name: str) -> str:
+        cls._label_font()
+        return cls._LABEL_METRICS.elidedText(name, Qt.TextElideMode.ElideRight, _TEXT_WIDTH)
+
+    def set_expanded(self, expanded: bool) -> None:
+        """Changes the expansion state and repaints the cached [+] / [-] toggle."""
+        if self.is_expanded != expanded:
+            self.is_expanded = expanded
+            self.update()
+
+    def set_name(self, name: str) -> None:
+        self.name = name
+        self._elided_name = self._elide(name)
+        self.update()
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, value: Any) -> Any:
-        if change == QGraphicsItem.ItemPositionHasChanged:
-            for conn in self.incoming_connections:
-                conn.update_path()
-            for conn in self.outgoing_connections:
-                conn.update_path()
+        if change == QGraphicsItem.ItemPositionHasChanged and not self.defer_connection_updates:
+            # Queued rather than repathed here: moves within one event-loop pass (multi-item drags)
+            # collapse into a single rebuild per edge
+            AnimatedConnection.schedule_repath(self.incoming_connections)
+            AnimatedConnection.schedule_repath(self.outgoing_connections)
         return super().itemChange(change, value)
 
     def add_connection(self, connection: 'AnimatedConnection', is_outgoing: bool) -> None:
@@ -67,61 +183,39 @@ class ProjectNode(QGraphicsObject):
             self.incoming_connections.append(connection)
 
     def boundingRect(self) -> QRectF:
-        return QRectF(0, 0, NODE_WIDTH, NODE_HEIGHT)
+        return _NODE_RECT
 
     def _get_toggle_rect(self) -> QRectF:
         """Defines the clickable area for the [+] / [-] icon."""
-        return QRectF(5, (NODE_HEIGHT - TOGGLE_BOX_SIZE) / 2, TOGGLE_BOX_SIZE, TOGGLE_BOX_SIZE)
+        return _TOGGLE_RECT
 
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: Optional[QWidget] = None) -> None:
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        node_rect = self.boundingRect()
-
-        bg_color = QColor("#21262d")
-        border_color = QColor("#30363d")
-        text_color = QColor("#8b949e")
-
-        if self.isSelected():
-            bg_color = QColor("#ffa500")
-            border_color = QColor("#ffa500").lighter(130)
-            text_color = QColor("#0d1117") # Dark text for better contrast on orange
-        elif self._is_hovered:
-            bg_color = bg_color.lighter(120)
-
-        path = QPainterPath()
-        path.addRoundedRect(node_rect, NODE_RADIUS, NODE_RADIUS)
-        painter.setPen(QPen(border_color, 1.5))
-        painter.fillPath(path, QBrush(bg_color))
-        painter.drawPath(path)
+        # No Antialiasing hint: the rounded body is antialiased once when its pixmap is built, and
+        # what is drawn here (blits, the axis-aligned toggle box, text) doesn't need path coverage.
+        # Text keeps its own TextAntialiasing hint.
+        state = _STATE_BY_FLAGS[self.isSelected()][self._is_hovered]
+        _, _, text_pen, toggle_pen, icon_color = _STYLES[state]
+
+        device = painter.device()
+        dpr = device.devicePixelRatioF() if device else 1.0
+        lod = option.levelOfDetailFromTransform(painter.worldTransform())
+        # Quantize the scale so zooming does not produce an unbounded number of cache entries
+        scale = max(1.0, round(dpr * lod * 4) / 4)
+        painter.drawPixmap(QPointF(0, 0), self._body_pixmap(state, scale))
 
         if self.child_nodes:
-            toggle_rect = self._get_toggle_rect()
-            painter.setPen(QPen(text_color, 1.5))
+            painter.setPen(toggle_pen)
             painter.setBrush(Qt.BrushStyle.NoBrush)
-            painter.drawRect(toggle_rect)
-
-            center = toggle_rect.center()
-            if self.is_expanded:
-                painter.drawLine(int(center.x() - 3), int(center.y()), int(center.x() + 3), int(center.y()))  # Minus
-            else:
-                painter.drawLine(int(center.x() - 3), int(center.y()), int(center.x() + 3),
-                                 int(center.y()))  # Horizontal
-                painter.drawLine(int(center.x()), int(center.y() - 3), int(center.x()), int(center.y() + 3))  # Vertical
-
-        icon_color = text_color if self.isSelected() else QColor("#8b949e")
-        icon_to_paint = qta.icon(self.icon_key, color=icon_color)
-
-        icon_x = 22
-        icon_rect = QRectF(icon_x, (NODE_HEIGHT - ICON_SIZE) / 2, ICON_SIZE, ICON_SIZE)
-        icon_to_paint.paint(painter, icon_rect.toRect())
-
-        text_x = icon_rect.right() + 8
-        text_width = NODE_WIDTH - text_x - 8
-        text_rect = QRectF(text_x, 0, text_width, NODE_HEIGHT)
-        painter.setPen(QPen(text_color))
-        painter.setFont(Typography.body())
-        elided_name = QFontMetrics(painter.font()).elidedText(self.name, Qt.TextElideMode.ElideRight, text_width)
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided_name)
+            painter.drawRect(_TOGGLE_RECT)
+            painter.drawLine(_TOGGLE_H_LINE)  # Minus, or the horizontal bar of the plus
+            if not self.is_expanded:
+                painter.drawLine(_TOGGLE_V_LINE)  # Vertical
+
+        painter.drawPixmap(_ICON_RECT.topLeft(), self._icon_pixmap(self.icon_key, icon_color, scale))
+
+        painter.setPen(text_pen)
+        painter.setFont(self._label_font())
+        painter.drawText(_TEXT_RECT, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, self._elided_name)
 
     def hoverEnterEvent(self, event: QGraphicsSceneHoverEvent) -> None:
         self._is_hovered = True
@@ -136,7 +230,8 @@ class ProjectNode(QGraphicsObject):
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle clicks to either toggle expansion or select/move the node."""
         if self.child_nodes and self._get_toggle_rect().contains(event.pos()):
-            self.toggle_requested.emit()
+            if self.on_toggle_requested:
+                self.on_toggle_requested(self)
             event.accept()
         else:
             super().mousePressEvent(event)
\ No newline at end of file
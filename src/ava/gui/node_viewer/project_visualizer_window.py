@@ -1,19 +1,19 @@
 # src/ava/gui/node_viewer/project_visualizer_window.py
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Any, Sequence, Tuple
+from functools import partial
 import qasync
 import os
+import sys
 
 from PySide6.QtCore import (
-    QPointF,
     QRectF,
     Qt,
     QTimer,
-    QPropertyAnimation,
-    QParallelAnimationGroup,
+    QTimeLine,
     QEasingCurve,
+    Signal,
 )
 from PySide6.QtGui import (
     QBrush,
@@ -21,9 +21,10 @@ from PySide6.QtGui import (
     QPainter,
     QCloseEvent,
     QWheelEvent,
+    QSurfaceFormat,
 )
 from PySide6.QtWidgets import (
-    QGraphicsObject,
+    QGraphicsItem,
     QGraphicsScene,
     QGraphicsView,
     QMainWindow,
@@ -32,35 +33,83 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
 )
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+except ImportError:
+    QOpenGLWidget = None
+
 from src.ava.core.event_bus import EventBus
 from src.ava.core.project_manager import ProjectManager
 from src.ava.gui.components import Colors
-from src.ava.gui.node_viewer.project_node import ProjectNode
+from src.ava.gui.node_viewer.project_node import ProjectNode, NODE_WIDTH, NODE_HEIGHT
 from src.ava.gui.node_viewer.animated_connection import AnimatedConnection
 from src.ava.services.code_structure_service import CodeStructureService
 from src.ava.gui.node_viewer.project_actions_sidebar import ProjectActionsSidebar
 from src.ava.gui.node_viewer.agent_node import AgentNode
+from src.ava.gui.node_viewer.tree_layout import layout_tree
 
 logger = logging.getLogger(__name__)
 
 # Constants for layout
 COLUMN_WIDTH = 250
 ROW_HEIGHT = 65
+LAYOUT_ANIMATION_MS = 400
+LAYOUT_FRAME_INTERVAL_MS = 16
+AGENT_ACTIVITY_INTERVAL_MS = 16
+RENDER_INTERVAL_MS = 16
+DEFAULT_MSAA_SAMPLES = 4
+# Below this zoom class/function labels are unreadable, so those nodes and their links are not drawn
+DETAIL_MIN_SCALE = 0.2
+# Below this many nodes and connections a linear item scan beats maintaining a BSP tree
+BSP_INDEX_MIN_ITEMS = 1000
+
+
+def _layout_order(node: ProjectNode) -> Tuple[bool, str]:
+    """Folders first, then everything else, each alphabetically."""
+    return node.node_type != 'folder', node.name
+
+
+def _msaa_samples() -> int:
+    """Reads AVA_VISUALIZER_MSAA, falling back to the default when it is not a usable integer."""
+    try:
+        return max(0, int(os.getenv("AVA_VISUALIZER_MSAA", str(DEFAULT_MSAA_SAMPLES))))
+    except ValueError:
+        return DEFAULT_MSAA_SAMPLES
 
 
 def _normalize_path_key(path_str: str) -> str:
     """A single, authoritative function to normalize a path for use as a dictionary key."""
-    return os.path.normcase(os.path.abspath(path_str))
+    # Interned, so lookups against self.nodes compare the stored keys by identity
+    return sys.intern(os.path.normcase(os.path.abspath(path_str)))
 
 
 class ZoomableView(QGraphicsView):
     """A QGraphicsView that supports zooming and panning."""
+    # Emitted with True/False when the zoom crosses DETAIL_MIN_SCALE
+    detail_level_changed = Signal(bool)
 
     def __init__(self, scene, parent=None):
         super().__init__(scene, parent)
+        self.show_detail = True
         self.setTransformationAnchor(QGraphicsView.AnchorViewCenter)
         self.setResizeAnchor(QGraphicsView.AnchorViewCenter)
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        if QOpenGLWidget is not None and os.getenv("AVA_VISUALIZER_OPENGL", "1") != "0":
+            # Rasterize on the GPU; set AVA_VISUALIZER_OPENGL=0 on hosts without working GL
+            gl_viewport = QOpenGLWidget()
+            # Start from the application default so any process-wide GL settings are kept
+            surface_format = QSurfaceFormat.defaultFormat()
+            # Keep edges antialiased on the GL surface; AVA_VISUALIZER_MSAA=0 turns it off on weak GPUs
+            surface_format.setSamples(_msaa_samples())
+            gl_viewport.setFormat(surface_format)
+            self.setViewport(gl_viewport)
+            # A GL viewport redraws whole frames, so partial-update bookkeeping only costs time
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            # Repaint only the regions that changed instead of the whole viewport
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        # Every item sets the pen/brush it paints with, so per-item save/restore is wasted work
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
 
     def wheelEvent(self, event: QWheelEvent):
         """Zoom in and out with the mouse wheel."""
@@ -68,6 +117,14 @@ class ZoomableView(QGraphicsView):
         zoom_out_factor = 1 / zoom_in_factor
         zoom_factor = zoom_in_factor if event.angleDelta().y() > 0 else zoom_out_factor
         self.scale(zoom_factor, zoom_factor)
+        self.update_detail_level()
+
+    def update_detail_level(self) -> None:
+        """Re-checks the zoom against DETAIL_MIN_SCALE; only a crossing is signalled."""
+        show_detail = self.transform().m11() >= DETAIL_MIN_SCALE
+        if show_detail != self.show_detail:
+            self.show_detail = show_detail
+            self.detail_level_changed.emit(show_detail)
 
 
 class ProjectVisualizerWindow(QMainWindow):
@@ -83,12 +140,37 @@ class ProjectVisualizerWindow(QMainWindow):
         self.connections: List[AnimatedConnection] = []
         self.agent_connections: List[AnimatedConnection] = []
         self._active_connections: List[AnimatedConnection] = []
-        self._animation_group = QParallelAnimationGroup()
+        # A single timeline moves every relocated node per frame, then repaths their connections once
+        self._layout_timeline = QTimeLine(LAYOUT_ANIMATION_MS, self)
+        self._layout_timeline.setEasingCurve(QEasingCurve.Type.InOutQuad)
+        self._layout_timeline.setUpdateInterval(LAYOUT_FRAME_INTERVAL_MS)
+        self._layout_timeline.valueChanged.connect(self._step_layout_animation)
+        self._layout_timeline.finished.connect(self._on_layout_animation_finished)
+        self._layout_moves: List[tuple] = []
+        self._layout_connections: List[AnimatedConnection] = []
+        self._fit_view_after_layout = False
+        self._last_fit: Optional[tuple] = None
+        # Extent of the laid-out tree, so callers need not walk every scene item for it
+        self._layout_bounds = QRectF()
+
+        # Agent activity can arrive in bursts; only the latest event per frame is drawn
+        self._pending_agent_activity: Optional[tuple] = None
+        self._agent_activity_timer = QTimer(self)
+        self._agent_activity_timer.setSingleShot(True)
+        self._agent_activity_timer.setInterval(AGENT_ACTIVITY_INTERVAL_MS)
+        self._agent_activity_timer.timeout.connect(self._flush_agent_activity)
+
+        # Whole-project re-renders can also be requested back to back (e.g. several generated
+        # test files); only the most recent request per frame rebuilds the scene
+        self._pending_render: Optional[Callable[[], None]] = None
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(RENDER_INTERVAL_MS)
+        self._render_timer.timeout.connect(self._flush_render)
 
         self.setWindowTitle("Project Visualizer & Test Lab")
         self.setGeometry(150, 150, 1400, 800)  # Made wider for the sidebar
         self.scene = QGraphicsScene()
-        self.scene.setBackgroundBrush(QColor(Colors.PRIMARY_BG))
 
         # --- Main Layout with Sidebar ---
         central_widget = QWidget()
@@ -98,8 +180,12 @@ class ProjectVisualizerWindow(QMainWindow):
 
         self.view = ZoomableView(self.scene, self)
         self.view.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # The background lives on the view so it can be cached and blitted when panning
+        self.view.setBackgroundBrush(QBrush(Colors.PRIMARY_BG))
+        self.view.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
         self.view.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
         self.view.customContextMenuRequested.connect(self._show_context_menu)
+        self.view.detail_level_changed.connect(self._set_structure_detail)
         main_layout.addWidget(self.view, 1)  # Graphics view takes up expanding space
 
         self.sidebar = ProjectActionsSidebar(event_bus, project_manager)
@@ -170,10 +256,26 @@ class ProjectVisualizerWindow(QMainWindow):
     @qasync.Slot(dict)
     def display_scaffold(self, scaffold_files: Dict[str, str]):
         if not self.project_manager.active_project_path: return
-        self._render_project_structure(scaffold_files)
+        self._schedule_render(partial(self._render_project_structure, scaffold_files))
 
     @qasync.Slot(str)
     def display_existing_project(self, project_path_str: str) -> None:
+        self._schedule_render(partial(self._load_existing_project, project_path_str))
+
+    def _schedule_render(self, render: Callable[[], None]) -> None:
+        self._pending_render = render
+        if not self._render_timer.isActive():
+            self._render_timer.start()
+
+    def _flush_render(self) -> None:
+        render, self._pending_render = self._pending_render, None
+        if render:
+            render()
+        # Activity that arrived while the render was queued was held back for the new nodes
+        if self._pending_agent_activity and not self._agent_activity_timer.isActive():
+            self._agent_activity_timer.start()
+
+    def _load_existing_project(self, project_path_str: str) -> None:
         project_files = self.project_manager.get_project_files()
         if not project_files:
             self.log("warning", f"No readable files found in project: {project_path_str}")
@@ -191,18 +293,41 @@ class ProjectVisualizerWindow(QMainWindow):
 
         tree = self._build_full_code_tree(project_files)
 
-        root_node = ProjectNode(root_path.name, str(root_path), 'folder')
-        root_key = _normalize_path_key(str(root_path))
-        self.nodes[root_key] = root_node
-        self.scene.addItem(root_node)
-
-        self._create_nodes_recursively(tree, root_path, root_node)
-
-        for node in self.nodes.values():
-            if node.parent_node and node.parent_node.parent_node:
-                node.is_expanded = False
-
-        self._set_children_visibility(root_node, root_node.is_expanded)
+        # Every node is inserted at the origin and then animated into place, so there is nothing to
+        # index yet; the layout pass picks the steady-state index once the nodes settle
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        # Each addItem/setVisible would otherwise queue its own viewport update
+        self.view.setUpdatesEnabled(False)
+        try:
+            root_node = ProjectNode(root_path.name, str(root_path), 'folder')
+            root_key = _normalize_path_key(str(root_path))
+            self.nodes[root_key] = root_node
+
+            # Nodes and connections are built off-scene, then added in one pass below
+            self._create_nodes(tree, root_path, root_node)
+
+            for node in self.nodes.values():
+                # The tree is fixed once built, so children are put in layout order here instead of on every relayout
+                node.child_nodes.sort(key=_layout_order)
+                if node.parent_node and node.parent_node.parent_node:
+                    node.set_expanded(False)
+
+            self._set_children_visibility(root_node, root_node.is_expanded)
+
+            # Collapsed subtrees are already hidden, so adding them invalidates nothing. The tree is
+            # walked rather than self.nodes so that nodes sharing a key are still added.
+            pending = [root_node]
+            while pending:
+                node = pending.pop()
+                self.scene.addItem(node)
+                pending.extend(node.child_nodes)
+            for conn in self.connections:
+                self.scene.addItem(conn)
+        finally:
+            self.view.setUpdatesEnabled(True)
+        if not self.view.show_detail:
+            self._set_structure_detail(False)
+        self.view.viewport().update()
         self._relayout_and_animate(fit_view=True)
 
     def _build_full_code_tree(self, project_files: Dict[str, str]) -> Dict:
@@ -216,31 +341,30 @@ class ProjectVisualizerWindow(QMainWindow):
             level['__structure__'] = structure
         return tree
 
-    def _create_nodes_recursively(self, subtree: Dict, parent_path: Path, parent_node: ProjectNode) -> None:
-        sorted_items = sorted(subtree.items(), key=lambda item: (
-            '__structure__' in item[1],
-            item[0]
-        ))
+    def _create_nodes(self, tree: Dict, root_path: Path, root_node: ProjectNode) -> None:
+        """Creates a node for every folder and file in the tree (plus their classes and functions)."""
+        # Explicit stack of (subtree, parent path, parent node); paths stay plain strings throughout
+        stack: List[Tuple[Dict, str, ProjectNode]] = [(tree, str(root_path), root_node)]
+        while stack:
+            subtree, parent_path_str, parent_node = stack.pop()
+            # No sort here: creation order is irrelevant, and _render_project_structure puts
+            # every node's children in layout order once the tree is built
+            for name, children in subtree.items():
+                if name == '__structure__': continue
 
-        for name, children in sorted_items:
-            if name == '__structure__': continue
+                current_path_str = os.path.join(parent_path_str, name)
+                is_folder = isinstance(children, dict) and '__structure__' not in children
+                node_type = 'folder' if is_folder else 'file'
 
-            current_path = parent_path / name
-            current_path_str = str(current_path)
-            is_folder = isinstance(children, dict) and '__structure__' not in children
-            node_type = 'folder' if is_folder else 'file'
+                node = ProjectNode(name, current_path_str, node_type)
+                self._setup_new_node(node, parent_node, _normalize_path_key(current_path_str))
 
-            node = ProjectNode(name, current_path_str, node_type)
-            node_key = _normalize_path_key(current_path_str) if node_type in ['file',
-                                                                              'folder'] else f"{_normalize_path_key(current_path_str)}::{name}"
-            self._setup_new_node(node, parent_node, node_key)
+                structure = children.get('__structure__')
+                if structure:
+                    self._create_structure_nodes(structure, current_path_str, node)
 
-            structure = children.get('__structure__')
-            if structure:
-                self._create_structure_nodes(structure, current_path_str, node)
-
-            if is_folder and children:
-                self._create_nodes_recursively(children, current_path, node)
+                if is_folder and children:
+                    stack.append((children, current_path_str, node))
 
     def _create_structure_nodes(self, structure: Dict, file_path_str: str, file_node: ProjectNode):
         for class_name in structure.get('classes', {}):
@@ -254,23 +378,21 @@ class ProjectVisualizerWindow(QMainWindow):
             self._setup_new_node(func_node, file_node, func_path_key)
 
     def _setup_new_node(self, child_node: ProjectNode, parent_node: ProjectNode, node_key: str):
-        self.nodes[node_key] = child_node
-        self.scene.addItem(child_node)
+        self.nodes[sys.intern(node_key)] = child_node
         child_node.parent_node = parent_node
         parent_node.child_nodes.append(child_node)
-        child_node.toggle_requested.connect(lambda n=child_node: self._handle_node_toggle(n))
+        child_node.on_toggle_requested = self._handle_node_toggle
         self._create_connection(parent_node, child_node)
 
-    def _create_connection(self, start_node: QGraphicsObject, end_node: ProjectNode) -> AnimatedConnection:
+    def _create_connection(self, start_node: QGraphicsItem, end_node: ProjectNode) -> AnimatedConnection:
         connection = AnimatedConnection(start_node, end_node)
-        self.scene.addItem(connection)
         start_node.add_connection(connection, is_outgoing=True)
         end_node.add_connection(connection, is_outgoing=False)
         self.connections.append(connection)
         return connection
 
     def _handle_node_toggle(self, node: ProjectNode):
-        node.is_expanded = not node.is_expanded
+        node.set_expanded(not node.is_expanded)
         self.log("info", f"Node '{node.name}' {'expanded' if node.is_expanded else 'collapsed'}.")
         self._set_children_visibility(node, node.is_expanded)
         self._relayout_and_animate()
@@ -286,63 +408,102 @@ class ProjectVisualizerWindow(QMainWindow):
             else:
                 self._set_children_visibility(child, False)
 
-    def _calculate_node_positions(self) -> Dict[str, QPointF]:
-        positions = {}
-        y_map = defaultdict(int)
-
+    def _calculate_node_positions(self) -> Tuple[List[ProjectNode], Sequence[float], Sequence[float]]:
+        """
+        Returns the nodes placed by the layout in layout order, with their target x and y
+        coordinates as two parallel sequences.
+        """
         root_path = str(self.project_manager.active_project_path) if self.project_manager.active_project_path else None
-        if not root_path: return {}
+        if not root_path: return [], [], []
 
         root_key = _normalize_path_key(root_path)
         root_node = self.nodes.get(root_key)
-        if not root_node: return {}
-
-        def layout_recursively(node: ProjectNode, depth: int):
-            node_key = _normalize_path_key(node.path) if node.node_type in ['file',
-                                                                            'folder'] else f"{_normalize_path_key(node.path)}::{node.name}"
-
-            x = depth * COLUMN_WIDTH
-            y = y_map[depth] * ROW_HEIGHT
-            positions[node_key] = QPointF(x, y)
-            y_map[depth] += 1
-
+        if not root_node: return [], [], []
+
+        # Flatten the visible tree into preorder nodes and depths; the coordinates are then
+        # computed from the depths alone, without touching the items again.
+        nodes: List[ProjectNode] = []
+        depths: List[int] = []
+        stack: List[Tuple[ProjectNode, int]] = [(root_node, 0)]
+        while stack:
+            node, depth = stack.pop()
+            nodes.append(node)
+            depths.append(depth)
             if node.is_expanded:
-                sorted_children = sorted(node.child_nodes, key=lambda n: (n.node_type != 'folder', n.name))
-                for child in sorted_children:
-                    if child.isVisible():
-                        layout_recursively(child, depth + 1)
-
-            if depth + 1 in y_map:
-                y_map[depth] = max(y_map[depth], y_map[depth + 1])
+                stack.extend((child, depth + 1) for child in reversed(node.child_nodes) if child.isVisible())
 
-        layout_recursively(root_node, 0)
-        return positions
+        xs, ys, row_count = layout_tree(depths, COLUMN_WIDTH, ROW_HEIGHT)
+        self._layout_bounds = QRectF(0, 0,
+                                     max(depths) * COLUMN_WIDTH + NODE_WIDTH,
+                                     (row_count - 1) * ROW_HEIGHT + NODE_HEIGHT)
+        return nodes, xs, ys
 
     def _relayout_and_animate(self, fit_view: bool = False):
         self.log("info", "Relaying out and animating nodes...")
-        new_positions = self._calculate_node_positions()
-
-        self._animation_group.stop()
-        self._animation_group = QParallelAnimationGroup()
-
-        for node_key, node in self.nodes.items():
-            if node.isVisible() and node_key in new_positions:
-                target_pos = new_positions[node_key]
-                if node.pos() != target_pos:
-                    anim = QPropertyAnimation(node, b"pos")
-                    anim.setEndValue(target_pos)
-                    anim.setDuration(400)
-                    anim.setEasingCurve(QEasingCurve.Type.InOutQuad)
-                    self._animation_group.addAnimation(anim)
-
-        self._animation_group.finished.connect(lambda: self._on_layout_animation_finished(fit_view))
-        self._animation_group.start()
-
-    def _on_layout_animation_finished(self, fit_view: bool):
+        nodes, target_xs, target_ys = self._calculate_node_positions()
+
+        self._layout_timeline.stop()
+        self._layout_moves = []
+        moved_connections: Dict[AnimatedConnection, None] = {}
+        # Only laid-out (visible) nodes are walked; hidden subtrees are never touched
+        # Moves are kept as plain floats, so animation frames call setPos(x, y) without building QPointFs
+        for node, target_x, target_y in zip(nodes, target_xs, target_ys):
+            start_x, start_y = node.x(), node.y()
+            if start_x != target_x or start_y != target_y:
+                self._layout_moves.append((node, start_x, start_y, target_x - start_x, target_y - start_y))
+                for conn in node.incoming_connections + node.outgoing_connections:
+                    if conn.isVisible():
+                        moved_connections[conn] = None
+        self._layout_connections = list(moved_connections)
+
+        # A relayout that interrupts a pending fit keeps the fit
+        self._fit_view_after_layout = self._fit_view_after_layout or fit_view
+        if not self._layout_moves:
+            self._on_layout_animation_finished()
+            return
+        # Moving items would update the BSP tree on every frame; rebuild it once when the animation ends
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        self._layout_timeline.start()
+
+    def _step_layout_animation(self, progress: float):
+        for node, start_x, start_y, delta_x, delta_y in self._layout_moves:
+            node.defer_connection_updates = True
+            node.setPos(start_x + delta_x * progress, start_y + delta_y * progress)
+            node.defer_connection_updates = False
+        # A connection between two moving nodes is repathed once per frame, not once per endpoint
+        update_path = AnimatedConnection.update_path
+        for conn in self._layout_connections:
+            update_path(conn)
+
+    def _on_layout_animation_finished(self):
+        self._layout_moves = []
+        self._layout_connections = []
+        self._settle_item_index()
         self._update_all_connections()
+        fit_view, self._fit_view_after_layout = self._fit_view_after_layout, False
         if fit_view:
             QTimer.singleShot(10, self._fit_view_with_padding)
 
+    def _set_structure_detail(self, show: bool) -> None:
+        """Skips painting class/function nodes and their links while zoomed too far out to read them."""
+        # ItemHasNoContents leaves visibility (expand/collapse state) and hit-testing untouched
+        for node in self.nodes.values():
+            if node.node_type in ('class', 'function'):
+                node.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents, not show)
+                for conn in node.incoming_connections:
+                    conn.setFlag(QGraphicsItem.GraphicsItemFlag.ItemHasNoContents, not show)
+                    if show:
+                        conn.update()
+                if show:
+                    node.update()
+
+    def _settle_item_index(self) -> None:
+        """Uses a BSP tree only for graphs big enough that hit-testing by linear scan would show."""
+        if len(self.nodes) + len(self.connections) >= BSP_INDEX_MIN_ITEMS:
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.BspTreeIndex)
+        else:
+            self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+
     def _update_all_connections(self):
         all_conns = self.connections + self.agent_connections
         for conn in all_conns:
@@ -350,10 +511,19 @@ class ProjectVisualizerWindow(QMainWindow):
                 conn.update_path()
 
     def _clear_scene(self) -> None:
+        # Pending agent activity is kept: it targets the project being rendered, not the old scene
+        self._layout_timeline.stop()
+        self._layout_moves = []
+        self._layout_connections = []
+        self._fit_view_after_layout = False
+        self._layout_bounds = QRectF()
+        # Nothing to index in an empty scene, and clear() skips the per-item BSP removal
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         for conn in self.connections:
-            conn.animation_timer.stop()
+            conn.deactivate()
         for conn in self.agent_connections:
-            conn.animation_timer.stop()
+            conn.deactivate()
+        AnimatedConnection.discard_pending_repaths()
         self.scene.clear()
         self.nodes.clear()
         self.agent_nodes.clear()
@@ -362,21 +532,30 @@ class ProjectVisualizerWindow(QMainWindow):
         self._active_connections.clear()
 
     def _fit_view_with_padding(self) -> None:
-        rect = self.scene.itemsBoundingRect()
-        if not rect.isValid(): return
+        if not self._layout_bounds.isValid(): return
         padding = 50
-        rect.adjust(-padding, -padding, padding, padding)
+        bounds = self._layout_bounds
+        # Agent nodes sit outside the tree layout, to the left of the root
+        for agent_node in self.agent_nodes.values():
+            bounds = bounds.united(agent_node.sceneBoundingRect())
+        rect = bounds.adjusted(-padding, -padding, padding, padding)
+        # Re-fitting the same rect into the same viewport is a no-op that still repaints everything
+        if self._view_fit_state(rect) == self._last_fit:
+            return
         self.view.fitInView(rect, Qt.AspectRatioMode.KeepAspectRatio)
+        self.view.update_detail_level()
+        self._last_fit = self._view_fit_state(rect)
+
+    def _view_fit_state(self, rect: QRectF) -> tuple:
+        return (rect, self.view.viewport().size(), self.view.transform(),
+                self.view.horizontalScrollBar().value(), self.view.verticalScrollBar().value())
 
     def _find_node_by_path(self, target_path: str) -> Optional[ProjectNode]:
-        norm_target_path = _normalize_path_key(target_path)
-        node = self.nodes.get(norm_target_path)
+        # File and folder nodes are keyed by their normalized path, so a dict miss
+        # means no such node exists; class/function keys always carry a '::' suffix.
+        node = self.nodes.get(_normalize_path_key(target_path))
         if node and node.node_type in ["file", "folder"]:
             return node
-
-        for node in self.nodes.values():
-            if _normalize_path_key(node.path) == norm_target_path and node.node_type in ["file", "folder"]:
-                return node
         return None
 
     def _ensure_node_visible(self, node: ProjectNode):
@@ -385,7 +564,7 @@ class ProjectVisualizerWindow(QMainWindow):
         current = node.parent_node
         while current:
             if not current.is_expanded:
-                current.is_expanded = True
+                current.set_expanded(True)
                 self._set_children_visibility(current, True)
                 needs_relayout = True
             current = current.parent_node
@@ -394,28 +573,55 @@ class ProjectVisualizerWindow(QMainWindow):
             self._relayout_and_animate()
 
     def _handle_agent_activity(self, agent_name: str, target_file_path: str):
+        self._pending_agent_activity = (agent_name, target_file_path)
+        if not self._agent_activity_timer.isActive():
+            self._agent_activity_timer.start()
+
+    def _flush_agent_activity(self):
+        if not self._pending_agent_activity:
+            return
+        if self._pending_render:
+            # The scene is about to be rebuilt; _flush_render re-arms the timer afterwards
+            return
+        agent_name, target_file_path = self._pending_agent_activity
+        self._pending_agent_activity = None
+        self._show_agent_activity(agent_name, target_file_path)
+
+    def _show_agent_activity(self, agent_name: str, target_file_path: str):
         self.log("info", f"Visualizing activity for Agent: {agent_name} on file: {Path(target_file_path).name}")
 
-        # Step 1: Clean up previous agent visuals
+        target_node = self._find_node_by_path(target_file_path)
+
+        # Step 1: Clean up previous agent visuals. The same agent moving on to
+        # another file keeps its node; only links that no longer apply are removed.
+        for name in [name for name in self.agent_nodes if name != agent_name]:
+            self.scene.removeItem(self.agent_nodes.pop(name))
+        agent_node = self.agent_nodes.get(agent_name)
+
+        existing_connection = None
         for conn in self.agent_connections:
-            self.scene.removeItem(conn)
-        self.agent_connections.clear()
-        for node in self.agent_nodes.values():
-            self.scene.removeItem(node)
-        self.agent_nodes.clear()
+            if target_node and conn.start_node is agent_node and conn.end_node is target_node:
+                existing_connection = conn
+            else:
+                self._remove_agent_connection(conn)
+        self.agent_connections = [existing_connection] if existing_connection else []
 
         # Step 2: Create the AgentNode
-        agent_node = AgentNode(agent_name)
-        self.agent_nodes[agent_name] = agent_node
-        self.scene.addItem(agent_node)
-        agent_y_pos = self.scene.itemsBoundingRect().center().y() if self.nodes else 0
-        agent_node.setPos(-200, agent_y_pos)
+        if not agent_node:
+            agent_node = AgentNode(agent_name)
+            self.agent_nodes[agent_name] = agent_node
+            self.scene.addItem(agent_node)
+            agent_y_pos = self._layout_bounds.center().y() if self.nodes else 0
+            agent_node.setPos(-200, agent_y_pos)
 
         # Step 3: Find the target ProjectNode
-        target_node = self._find_node_by_path(target_file_path)
         if not target_node:
             self.log("warning", f"Could not find a node for target path: {target_file_path}")
             return
+        if existing_connection:
+            # Already linked and pulsing; nothing to rebuild
+            self._ensure_node_visible(target_node)
+            return
 
         # Step 4: Create the connection BEFORE any potential relayout
         connection = AnimatedConnection(agent_node, target_node)
@@ -438,22 +644,41 @@ class ProjectVisualizerWindow(QMainWindow):
         color = agent_colors.get(agent_name, Colors.ACCENT_BLUE)
         connection.activate(color)
 
-    def _deactivate_all_connections(self, *args, **kwargs):
+    def _deactivate_all_connections(self):
+        self._agent_activity_timer.stop()
+        self._pending_agent_activity = None
+        if not (self._active_connections or self.agent_connections or self.agent_nodes):
+            return
         self.log("info", "Deactivating all agent and project visualizations.")
 
-        # Deactivate any pulsing project-to-project connections
-        for conn in self._active_connections:
-            conn.deactivate()
-        self._active_connections.clear()
-
-        # Remove agent nodes and their connections
-        for conn in self.agent_connections:
-            self.scene.removeItem(conn)
-        self.agent_connections.clear()
-
-        for agent_node in self.agent_nodes.values():
-            self.scene.removeItem(agent_node)
-        self.agent_nodes.clear()
+        # Tear everything down with viewport updates off, then repaint once
+        self.view.setUpdatesEnabled(False)
+        try:
+            # Deactivate any pulsing project-to-project connections
+            for conn in self._active_connections:
+                conn.deactivate()
+            self._active_connections.clear()
+
+            # Remove agent nodes and their connections
+            for conn in self.agent_connections:
+                self._remove_agent_connection(conn)
+            self.agent_connections.clear()
+
+            for agent_node in self.agent_nodes.values():
+                self.scene.removeItem(agent_node)
+            self.agent_nodes.clear()
+        finally:
+            self.view.setUpdatesEnabled(True)
+            self.view.viewport().update()
+
+    def _remove_agent_connection(self, conn: AnimatedConnection) -> None:
+        """Removes an agent link from the scene and from the nodes that track it."""
+        conn.deactivate()
+        if conn in conn.end_node.incoming_connections:
+            conn.end_node.incoming_connections.remove(conn)
+        if conn in conn.start_node.outgoing_connections:
+            conn.start_node.outgoing_connections.remove(conn)
+        self.scene.removeItem(conn)
 
     def show(self) -> None:
         super().show()
@@ -0,0 +1,65 @@
+# src/ava/gui/node_viewer/tree_layout.py
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _layout_rows(depths: Sequence[int], next_row: List[int], xs: List[float], ys: List[float],
+                 column_width: float, row_height: float) -> None:
+    """
+    Fills xs/ys for a tree given as the preorder depths of its nodes. Each depth is a column and
+    a node takes the next free row in its column; once a node's subtree is finished, its column
+    is pushed down past the deepest row the subtree used. next_row must hold max depth + 2 zeros.
+    Only indexes into its arguments, so it can be compiled by numba over arrays when available.
+    """
+    open_depth = -1  # depth of the last placed node; every shallower ancestor is still open
+    for i in range(len(depths)):
+        depth = depths[i]
+        # Nodes at this depth or deeper that are still open have finished their subtrees
+        while open_depth >= depth:
+            if next_row[open_depth + 1] > next_row[open_depth]:
+                next_row[open_depth] = next_row[open_depth + 1]
+            open_depth -= 1
+        xs[i] = depth * column_width
+        ys[i] = next_row[depth] * row_height
+        next_row[depth] += 1
+        open_depth = depth
+    while open_depth >= 0:
+        if next_row[open_depth + 1] > next_row[open_depth]:
+            next_row[open_depth] = next_row[open_depth + 1]
+        open_depth -= 1
+
+
+def layout_tree(depths: Sequence[int], column_width: float,
+                row_height: float) -> Tuple[List[float], List[float], int]:
+    """
+    Lays out a tree given as preorder node depths. Returns the x and y of every node, in the
+    same order, plus the number of rows the tallest column uses.
+    """
+    count = len(depths)
+    if not count:
+        return [], [], 0
+    if njit is not None:
+        depth_array = np.array(depths, dtype=np.int64)
+        next_row = np.zeros(int(depth_array.max()) + 2, dtype=np.int64)
+        xs = np.zeros(count, dtype=np.float64)
+        ys = np.zeros(count, dtype=np.float64)
+        _layout_rows_compiled(depth_array, next_row, xs, ys, float(column_width), float(row_height))
+        # Callers hand the coordinates straight to Qt, which wants Python floats
+        return xs.tolist(), ys.tolist(), int(next_row.max())
+    next_row = [0] * (max(depths) + 2)
+    xs = [0.0] * count
+    ys = [0.0] * count
+    _layout_rows(depths, next_row, xs, ys, float(column_width), float(row_height))
+    return xs, ys, max(next_row)
+
+
+if njit is not None:
+    _layout_rows_compiled = njit(cache=True)(_layout_rows)
+    # Compile at import (app start) rather than on the first project render
+    _layout_rows_compiled(np.zeros(1, dtype=np.int64), np.zeros(2, dtype=np.int64),
+                          np.zeros(1), np.zeros(1), 1.0, 1.0)
@@ -1,6 +1,9 @@
 # src/ava/gui/status_bar.py
+from typing import Dict, Tuple
+
 from PySide6.QtWidgets import QStatusBar, QLabel
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QPixmap
 import qtawesome as qta
 
 from .components import Colors, Typography
@@ -12,6 +15,9 @@ class StatusBar(QStatusBar):
     RAG service status, and dynamic AI agent activity.
     """
 
+    # Rendered status icons shared for the lifetime of the app, keyed by (icon name, color)
+    _ICON_CACHE: Dict[Tuple[str, str], QPixmap] = {}
+
     def __init__(self, event_bus):
         super().__init__()
         self.event_bus = event_bus
@@ -43,7 +49,7 @@ class StatusBar(QStatusBar):
 
         # -- Git Branch --
         self.branch_icon = QLabel()
-        self.branch_icon.setPixmap(qta.icon("fa5s.code-branch", color=Colors.TEXT_SECONDARY.name()).pixmap(12, 12))
+        self.branch_icon.setPixmap(self._icon_pixmap("fa5s.code-branch", Colors.TEXT_SECONDARY.name()))
         self.branch_label = QLabel("(no branch)")
         self.addPermanentWidget(self.branch_icon)
         self.addPermanentWidget(self.branch_label)
@@ -54,13 +60,23 @@ class StatusBar(QStatusBar):
 
         # -- RAG Status --
         self.rag_icon = QLabel()
-        self.rag_icon.setPixmap(qta.icon("fa5s.brain", color=Colors.TEXT_SECONDARY.name()).pixmap(12, 12))
+        self.rag_icon.setPixmap(self._icon_pixmap("fa5s.brain", Colors.TEXT_SECONDARY.name()))
         self.rag_label = QLabel("RAG: Initializing...")
         self.addPermanentWidget(self.rag_icon)
         self.addPermanentWidget(self.rag_label)
 
         self._connect_events()
 
+    @classmethod
+    def _icon_pixmap(cls, icon_name: str, color: str) -> QPixmap:
+        """Returns the 12px status icon, rendering it only the first time a (name, color) pair is seen."""
+        key = (icon_name, color)
+        pixmap = cls._ICON_CACHE.get(key)
+        if pixmap is None:
+            pixmap = qta.icon(icon_name, color=color).pixmap(12, 12)
+            cls._ICON_CACHE[key] = pixmap
+        return pixmap
+
     def _connect_events(self):
         self.event_bus.subscribe("branch_updated", self.on_branch_updated)
         self.event_bus.subscribe("log_message_received", self.on_log_message)
@@ -84,12 +100,12 @@ class StatusBar(QStatusBar):
                 color = Colors.ACCENT_RED.name()
             elif msg_type == "info" and ("ingest" in content.lower() or "scan" in content.lower()):
                 color = Colors.ACCENT_BLUE.name()
-            self.rag_icon.setPixmap(qta.icon("fa5s.brain", color=color).pixmap(12, 12))
+            self.rag_icon.setPixmap(self._icon_pixmap("fa5s.brain", color))
 
     def update_agent_status(self, agent_name: str, status_text: str, icon_name: str):
         """Public method to update the agent status section of the status bar."""
         self.agent_status_label.setText(f"{agent_name}: {status_text}")
-        self.agent_icon.setPixmap(qta.icon(icon_name, color=Colors.ACCENT_BLUE.name()).pixmap(12, 12))
+        self.agent_icon.setPixmap(self._icon_pixmap(icon_name, Colors.ACCENT_BLUE.name()))
 
     def _on_workflow_finished(self):
         """Resets the agent status to 'Ready' when a workflow completes."""
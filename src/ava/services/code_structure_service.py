@@ -1,7 +1,14 @@
 # src/ava/services/code_structure_service.py
+import hashlib
 import re
 from typing import Dict, Any
 
+# Regex to find top-level class and function definitions.
+# It captures the name of the class/function.
+# It's simplified to look for lines starting with 'class' or 'def'.
+_DEFINITION_PATTERN = re.compile(r"^(class|def)\s+([a-zA-Z_]\w*)")
+STRUCTURE_CACHE_LIMIT = 2048
+
 
 class CodeStructureService:
     """
@@ -9,6 +16,10 @@ class CodeStructureService:
     for visualization. This is not a full parser but is robust against syntax errors.
     """
 
+    def __init__(self):
+        # Re-renders re-scan every file; unchanged content reuses its previous result
+        self._structure_cache: Dict[bytes, Dict[str, Any]] = {}
+
     def parse_structure(self, code: str) -> Dict[str, Any]:
         """
         Scans Python code and returns a dictionary of its classes and functions.
@@ -22,15 +33,15 @@ class CodeStructureService:
             A dictionary detailing the names of classes and standalone functions.
             The 'code' value is intentionally left blank as this is not a full parser.
         """
-        structure = {"classes": {}, "functions": {}}
+        cache_key = hashlib.blake2b(code.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        cached = self._structure_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        # Regex to find top-level class and function definitions.
-        # It captures the name of the class/function.
-        # It's simplified to look for lines starting with 'class' or 'def'.
-        pattern = re.compile(r"^(class|def)\s+([a-zA-Z_]\w*)")
+        structure = {"classes": {}, "functions": {}}
 
         for line in code.splitlines():
-            match = pattern.match(line.strip())
+            match = _DEFINITION_PATTERN.match(line.strip())
             if match:
                 keyword, name = match.groups()
                 if keyword == "class":
@@ -40,4 +51,7 @@ class CodeStructureService:
                 elif keyword == "def":
                     structure["functions"][name] = ""  # Just the name is needed.
 
+        if len(self._structure_cache) >= STRUCTURE_CACHE_LIMIT:
+            self._structure_cache.clear()
+        self._structure_cache[cache_key] = structure
         return structure
\ No newline at end of file